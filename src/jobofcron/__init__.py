@@ -1,29 +1,88 @@
 """Jobofcron – Indeed job application automation toolkit."""
 
-from .application_automation import AutomationDependencyError, DirectApplyAutomation, EmailApplicationSender
-from .application_queue import ApplicationQueue, QueuedApplication
-from .document_generation import (
-    AIDocumentGenerator,
-    DocumentGenerationDependencyError,
-    DocumentGenerationError,
-    available_cover_letter_templates,
-    available_resume_templates,
-    generate_cover_letter,
-    generate_resume,
-)
-from .job_history import AppliedJobRegistry
-from .job_matching import JobPosting, MatchAssessment, analyse_job_fit, extract_required_skills
-from .job_search import CraigslistSearch, GoogleJobSearch, SearchResult
-from .profile import CandidateProfile, Experience, JobPreference
-from .scheduler import ScheduledApplication, plan_schedule
-from .skills_inventory import SkillRecord, SkillsInventory
-from .storage import Storage
-from .worker import JobAutomationWorker
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .application_automation import (
+        ApiApplySubmitter,
+        ApplyJob,
+        AutomationDependencyError,
+        DirectApplyAutomation,
+        EmailApplicationSender,
+        EmailJob,
+    )
+    from .application_queue import ApplicationQueue, QueuedApplication
+    from .document_generation import (
+        AIDocumentGenerator,
+        DocumentGenerationDependencyError,
+        DocumentGenerationError,
+        available_cover_letter_templates,
+        available_resume_templates,
+        generate_cover_letter,
+        generate_resume,
+    )
+    from .job_history import AppliedJobRegistry
+    from .job_matching import (
+        JobPosting,
+        MatchAssessment,
+        analyse_job_fit,
+        analyse_job_fits,
+        extract_required_skills,
+    )
+    from .job_search import CraigslistSearch, GoogleJobSearch, SearchResult
+    from .profile import CandidateProfile, Experience, JobPreference
+    from .scheduler import JobRow, ScheduledApplication, plan_schedule
+    from .skills_inventory import SkillRecord, SkillsInventory
+    from .storage import Storage, StorageDependencyError
+    from .worker import JobAutomationWorker
+
+# Submodules are imported on first attribute access so that ``import jobofcron``
+# (and with it every CLI invocation) does not pay for requests, asyncio or the
+# SMTP stack until a command actually needs them.
+_EXPORTS = {
+    "ApiApplySubmitter": ".application_automation",
+    "ApplyJob": ".application_automation",
+    "AutomationDependencyError": ".application_automation",
+    "DirectApplyAutomation": ".application_automation",
+    "EmailApplicationSender": ".application_automation",
+    "EmailJob": ".application_automation",
+    "ApplicationQueue": ".application_queue",
+    "QueuedApplication": ".application_queue",
+    "AIDocumentGenerator": ".document_generation",
+    "DocumentGenerationDependencyError": ".document_generation",
+    "DocumentGenerationError": ".document_generation",
+    "available_cover_letter_templates": ".document_generation",
+    "available_resume_templates": ".document_generation",
+    "generate_cover_letter": ".document_generation",
+    "generate_resume": ".document_generation",
+    "AppliedJobRegistry": ".job_history",
+    "JobPosting": ".job_matching",
+    "MatchAssessment": ".job_matching",
+    "analyse_job_fit": ".job_matching",
+    "analyse_job_fits": ".job_matching",
+    "extract_required_skills": ".job_matching",
+    "CraigslistSearch": ".job_search",
+    "GoogleJobSearch": ".job_search",
+    "SearchResult": ".job_search",
+    "CandidateProfile": ".profile",
+    "Experience": ".profile",
+    "JobPreference": ".profile",
+    "JobRow": ".scheduler",
+    "ScheduledApplication": ".scheduler",
+    "plan_schedule": ".scheduler",
+    "SkillRecord": ".skills_inventory",
+    "SkillsInventory": ".skills_inventory",
+    "Storage": ".storage",
+    "StorageDependencyError": ".storage",
+    "JobAutomationWorker": ".worker",
+}
 
 __all__ = [
     "JobPosting",
     "MatchAssessment",
     "analyse_job_fit",
+    "analyse_job_fits",
     "extract_required_skills",
     "GoogleJobSearch",
     "CraigslistSearch",
@@ -35,7 +94,9 @@ __all__ = [
     "SkillRecord",
     "SkillsInventory",
     "ScheduledApplication",
+    "JobRow",
     "Storage",
+    "StorageDependencyError",
     "plan_schedule",
     "ApplicationQueue",
     "QueuedApplication",
@@ -46,8 +107,25 @@ __all__ = [
     "AIDocumentGenerator",
     "DocumentGenerationDependencyError",
     "DocumentGenerationError",
+    "ApiApplySubmitter",
+    "ApplyJob",
     "DirectApplyAutomation",
     "EmailApplicationSender",
+    "EmailJob",
     "AutomationDependencyError",
     "JobAutomationWorker",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,18 +2,31 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import copy
+import os
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 import random
+import re
 import smtplib
+import ssl
+import threading
+import time
+import weakref
+from dataclasses import dataclass
 from email.message import EmailMessage
 from pathlib import Path
-from typing import Iterable, Mapping, Optional
+from typing import Iterable, Mapping, Optional, Sequence
 
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus, urlparse
+
+import requests
 
 from .job_matching import JobPosting
 from .profile import CandidateProfile
+from .storage import read_json, write_json
 
 
 class AutomationDependencyError(RuntimeError):
@@ -36,10 +49,398 @@ DEFAULT_VIEWPORTS = (
     {"width": 1440, "height": 900},
 )
 
+BROWSER_LAUNCH_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--disable-dev-shm-usage",
+)
+
+
+def _load_playwright():
+    try:
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import async_playwright
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+        raise AutomationDependencyError(
+            "Install the 'automation' optional dependency group (pip install jobofcron[automation])"
+        ) from exc
+    return async_playwright, PlaywrightTimeoutError
+
+
+# How many ``timeout`` periods ``acquire`` waits for a pooled browser.
+_POOL_ACQUIRE_TIMEOUT_FACTOR = 10
+
+# Placed on the idle queue instead of a browser whose replacement failed to
+# launch, so the slot is retried by the next ``acquire`` rather than lost.
+_RELAUNCH = object()
+
+
+class _BrowserPool:
+    """Keep pre-launched Chromium browsers around so applications can share them."""
+
+    def __init__(
+        self,
+        launcher,
+        *,
+        size: int,
+        max_uses: int,
+        acquire_timeout: Optional[float] = None,
+    ) -> None:
+        self._launcher = launcher
+        self.size = size
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._uses: dict[int, int] = {}
+        self._browsers: list = []
+
+    async def start(self) -> None:
+        for _ in range(self.size):
+            self._idle.put_nowait(await self._launch())
+
+    async def _launch(self):
+        browser = await self._launcher()
+        self._uses[id(browser)] = 0
+        self._browsers.append(browser)
+        return browser
+
+    async def _retire(self, browser) -> None:
+        self._uses.pop(id(browser), None)
+        if browser in self._browsers:
+            self._browsers.remove(browser)
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    async def acquire(self):
+        try:
+            browser = await asyncio.wait_for(self._idle.get(), self.acquire_timeout)
+        except asyncio.TimeoutError as exc:
+            raise AutomationDependencyError(
+                f"No pooled browser became available within {self.acquire_timeout} seconds"
+            ) from exc
+        if browser is _RELAUNCH:
+            try:
+                browser = await self._launch()
+            except Exception as exc:
+                self._idle.put_nowait(_RELAUNCH)
+                raise AutomationDependencyError(f"Could not relaunch a pooled browser: {exc}") from exc
+        return browser
+
+    async def release(self, browser) -> None:
+        uses = self._uses.get(id(browser), 0) + 1
+        if uses >= self.max_uses or not browser.is_connected():
+            await self._retire(browser)
+            try:
+                browser = await self._launch()
+            except Exception:
+                # Keep the slot: the next acquire retries the launch and
+                # surfaces the error to its caller instead of this cleanup.
+                browser = _RELAUNCH
+        else:
+            self._uses[id(browser)] = uses
+        self._idle.put_nowait(browser)
+
+    async def close(self) -> None:
+        for browser in list(self._browsers):
+            await self._retire(browser)
+
+
+@lru_cache(maxsize=4096)
+def _apply_domain(url: str) -> str:
+    """Return the lower-cased host of an apply URL; retries reuse the parse."""
+
+    return urlparse(url).netloc.lower()
+
+
+@lru_cache(maxsize=1024)
+def _handler_key(domain: str) -> str:
+    if "greenhouse.io" in domain:
+        return "greenhouse"
+    if "lever.co" in domain:
+        return "lever"
+    if "workday" in domain or "myworkdayjobs" in domain:
+        return "workday"
+    if "icims.com" in domain:
+        return "icims"
+    return "generic"
+
+
+@dataclass
+class ApplyJob:
+    """A single browser application to submit in a batch."""
+
+    posting: JobPosting
+    resume_path: Optional[Path] = None
+    cover_letter_path: Optional[Path] = None
+    answers: Optional[Mapping[str, str]] = None
+
+
+@lru_cache(maxsize=1024)
+def _api_target(url: str) -> Optional[tuple[str, str, str]]:
+    """Return ``(ats, board, posting_id)`` for Greenhouse or Lever job URLs."""
+
+    parsed = urlparse(url)
+    domain = parsed.netloc.lower()
+    parts = [part for part in parsed.path.split("/") if part]
+    if "greenhouse.io" in domain:
+        # boards.greenhouse.io/<board>/jobs/<id>
+        if len(parts) >= 3 and parts[1] == "jobs":
+            return "greenhouse", parts[0], parts[2]
+        return None
+    if "lever.co" in domain:
+        # jobs.lever.co/<site>/<posting id>[/apply]
+        if len(parts) >= 2:
+            return "lever", parts[0], parts[1]
+    return None
+
+
+class ApiApplySubmitter:
+    """Submit Greenhouse and Lever applications over their HTTP APIs.
+
+    Both APIs require an employer-issued key, so only ATSes with a configured
+    key are attempted. ``try_apply`` returns ``False`` whenever the API path is
+    unavailable or rejected so callers can fall back to the browser.
+    """
+
+    GREENHOUSE_ENDPOINT = "https://boards-api.greenhouse.io/v1/boards/{board}/jobs/{posting_id}"
+    LEVER_ENDPOINT = "https://api.lever.co/v0/postings/{board}/{posting_id}"
+
+    def __init__(
+        self,
+        *,
+        greenhouse_api_key: Optional[str] = None,
+        lever_api_key: Optional[str] = None,
+        timeout: int = 30,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        self.greenhouse_api_key = greenhouse_api_key
+        self.lever_api_key = lever_api_key
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+    def supports(self, url: Optional[str]) -> bool:
+        target = _api_target(url) if url else None
+        if target is None:
+            return False
+        return bool(self.greenhouse_api_key if target[0] == "greenhouse" else self.lever_api_key)
+
+    def try_apply(
+        self,
+        profile: CandidateProfile,
+        posting: JobPosting,
+        *,
+        resume_path: Optional[Path] = None,
+        cover_letter_path: Optional[Path] = None,
+        answers: Optional[Mapping[str, str]] = None,
+    ) -> bool:
+        if not self.supports(posting.apply_url):
+            return False
+        ats, board, posting_id = _api_target(posting.apply_url)
+        first_name, last_name = DirectApplyAutomation._split_name(profile.name)
+
+        if ats == "greenhouse":
+            url = self.GREENHOUSE_ENDPOINT.format(board=board, posting_id=posting_id)
+            data = {"first_name": first_name, "last_name": last_name, "email": profile.email}
+            file_fields = {"resume": resume_path, "cover_letter": cover_letter_path}
+            field_prefixes: tuple[str, ...] = ("question_",)
+            request_kwargs = {"auth": (self.greenhouse_api_key, "")}
+        else:
+            url = self.LEVER_ENDPOINT.format(board=board, posting_id=posting_id)
+            data = {"name": profile.name, "email": profile.email}
+            file_fields = {"resume": resume_path}
+            field_prefixes = ("cards[", "urls[", "comments")
+            request_kwargs = {"params": {"key": self.lever_api_key}}
+        if profile.phone:
+            data["phone"] = profile.phone
+        # Free-form browser answers are keyed by label text; only forward keys
+        # that already use the API's field naming.
+        for key, value in (answers or {}).items():
+            if key.startswith(field_prefixes):
+                data[key] = value
+
+        files = {
+            name: (path.name, path.read_bytes())
+            for name, path in file_fields.items()
+            if path and path.exists()
+        }
+        try:
+            response = self.session.post(url, data=data, files=files or None, timeout=self.timeout, **request_kwargs)
+        except requests.RequestException:
+            return False
+        return 200 <= response.status_code < 300
+
 
 class DirectApplyAutomation:
     """Drive a Playwright browser session to submit job applications."""
 
+    _HANDLERS = {
+        "greenhouse": "_apply_greenhouse",
+        "lever": "_apply_lever",
+        "workday": "_apply_workday",
+        "icims": "_apply_icims",
+        "generic": "_apply_generic",
+    }
+
+    # CSS selector lists match any alternative, so each field resolves in one probe.
+    _GREENHOUSE_FIRST_NAME = "input[name='first_name']"
+    _GREENHOUSE_LAST_NAME = "input[name='last_name']"
+    _GREENHOUSE_EMAIL = "input[name='email']"
+    _GREENHOUSE_PHONE = "input[name='phone']"
+    _GREENHOUSE_RESUME = "input[type='file'][name='resume']"
+    _GREENHOUSE_COVER_LETTER = "input[type='file'][name='cover_letter']"
+
+    _LEVER_NAME = "input[name='name']"
+    _LEVER_EMAIL = "input[name='email']"
+    _LEVER_PHONE = "input[name='phone']"
+    _LEVER_RESUME = "input[type='file'][name='resume']"
+    _LEVER_COVER_LETTER = "input[type='file'][name='coverLetter']"
+
+    # Alternatives in priority order: the first selector that matches wins,
+    # since the broader fallbacks can also match unrelated inputs.
+    _WORKDAY_FIRST_NAME = (
+        "input[data-automation-id='firstName']",
+        "input[name='firstName']",
+        "input[aria-label='First Name']",
+    )
+    _WORKDAY_LAST_NAME = (
+        "input[data-automation-id='lastName']",
+        "input[name='lastName']",
+        "input[aria-label='Last Name']",
+    )
+    _WORKDAY_EMAIL = (
+        "input[data-automation-id='email']",
+        "input[name='email']",
+        "input[aria-label='Email Address']",
+    )
+    _WORKDAY_PHONE = (
+        "input[data-automation-id='phoneNumber']",
+        "input[name='phoneNumber']",
+        "input[aria-label='Primary Phone']",
+    )
+    _WORKDAY_RESUME = (
+        "input[data-automation-id='resumeUploadInput']",
+        "input[data-automation-id='resumeField']",
+        "input[name='resumeUpload']",
+    )
+    _WORKDAY_COVER_LETTER = (
+        "input[data-automation-id='coverLetterUpload']",
+        "input[name='coverLetterUpload']",
+    )
+
+    _ICIMS_FIRST_NAME = (
+        "input#firstName",
+        "input[name='firstName']",
+        "input[aria-label='First Name']",
+    )
+    _ICIMS_LAST_NAME = (
+        "input#lastName",
+        "input[name='lastName']",
+        "input[aria-label='Last Name']",
+    )
+    _ICIMS_EMAIL = (
+        "input#email",
+        "input[name='email']",
+        "input[type='email']",
+    )
+    _ICIMS_PHONE = (
+        "input#phone",
+        "input[name='phone']",
+        "input[aria-label='Phone']",
+    )
+    _ICIMS_RESUME = (
+        "input#resume",
+        "input[name='resume']",
+        "input[data-testid='resume-upload']",
+    )
+    _ICIMS_COVER_LETTER = (
+        "input#coverLetter",
+        "input[name='coverLetter']",
+    )
+
+    # Scripts that read an attribute from every match in a single round-trip.
+    _JS_INPUT_NAMES = "els => els.map(e => (e.getAttribute('name') || '').toLowerCase())"
+    _JS_PLACEHOLDERS = "els => els.map(e => (e.getAttribute('placeholder') || '').toLowerCase())"
+    _JS_BUTTON_LABELS = "els => els.map(e => (e.innerText || e.value || '').trim().toLowerCase())"
+
+    _JS_BATCH_FILL = """(pairs) => {
+        const missing = [];
+        pairs.forEach(([selector, value], index) => {
+            const el = document.querySelector(selector);
+            if (!el) { missing.push(index); return; }
+            const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+            el.focus();
+            if (setter && setter.set) { setter.set.call(el, value); } else { el.value = value; }
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+        });
+        return missing;
+    }"""
+
+    # Returns an id or name selector that finds the element again on a later
+    # posting from the same board, or null when it has neither.
+    _JS_STABLE_SELECTOR = """(el) => {
+        if (el.id) return '#' + CSS.escape(el.id);
+        const name = el.getAttribute('name');
+        return name ? `${el.tagName.toLowerCase()}[name="${CSS.escape(name)}"]` : null;
+    }"""
+
+    _JS_FILL_BY_LABEL = """(pairs) => {
+        const stableSelector = """ + _JS_STABLE_SELECTOR + """;
+        const labels = Array.from(document.querySelectorAll('label'));
+        const inputs = Array.from(document.querySelectorAll('input, textarea'));
+        const unique = (items) => {
+            const distinct = [...new Set(items.filter(Boolean))];
+            return distinct.length === 1 ? distinct[0] : null;
+        };
+        const filled = [];
+        for (const [key, value] of pairs) {
+            const needle = key.toLowerCase();
+            const target = unique(labels
+                .filter((label) => (label.textContent || '').toLowerCase().includes(needle))
+                .map((label) => label.control || label.querySelector('input, textarea')))
+                || unique(inputs.filter((el) => (el.getAttribute('placeholder') || '').toLowerCase().includes(needle)));
+            if (!target) continue;
+            const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(target), 'value');
+            target.focus();
+            if (setter && setter.set) { setter.set.call(target, value); } else { target.value = value; }
+            target.dispatchEvent(new Event('input', { bubbles: true }));
+            target.dispatchEvent(new Event('change', { bubbles: true }));
+            filled.push([key, stableSelector(target)]);
+        }
+        return filled;
+    }"""
+
+    _SUBMIT_RE = re.compile(r"submit|apply|send|next", re.IGNORECASE)
+    _SUBMIT_SELECTOR = ", ".join((
+        "button:text-matches('submit|apply|send|next', 'i')",
+        "input[type='submit'][value*='submit' i]",
+        "input[type='submit'][value*='apply' i]",
+        "input[type='submit'][value*='send' i]",
+        "input[type='submit'][value*='next' i]",
+    ))
+
+    # Init scripts are joined so each context needs a single injection.
+    _INIT_SCRIPT = "\n".join((
+        "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});",
+        "window.chrome = {runtime: {}};",
+        "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});",
+    ))
+
+    # Generic pages do not always wrap their fields in a <form>, so any input
+    # showing up is enough to start filling.
+    _GENERIC_READY = "form, input, textarea"
+
+    # Workday and iCIMS posting URLs often land on a job page that only shows
+    # an Apply button, so either a form field or a control that
+    # ``_submit_application`` can click means the page is ready.
+    _ATS_READY = ", ".join((_GENERIC_READY, _SUBMIT_SELECTOR))
+
+    # Shared loop used when ``apply`` is called while another loop is running.
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
+
     def __init__(
         self,
         *,
@@ -49,6 +450,10 @@ class DirectApplyAutomation:
         user_agent: Optional[str] = None,
         locale: str = "en-US",
         timezone: str = "UTC",
+        cdp_endpoint: Optional[str] = None,
+        api_submitter: Optional[ApiApplySubmitter] = None,
+        browsers_path: Optional[Path] = None,
+        form_schema_path: Optional[Path] = None,
     ) -> None:
         self.headless = headless
         self.timeout = timeout
@@ -56,7 +461,116 @@ class DirectApplyAutomation:
         self.user_agent = user_agent
         self.locale = locale
         self.timezone = timezone
-
+        self.cdp_endpoint = cdp_endpoint
+        self.api_submitter = api_submitter
+        # Contact, upload and submit selectors discovered per ATS board, reused
+        # on later postings from the same employer and optionally persisted
+        # as JSON.
+        self.form_schema_path = Path(form_schema_path) if form_schema_path else None
+        self._form_schema: dict[str, dict[str, str]] = {}
+        self._form_schema_dirty = False
+        if self.form_schema_path is not None and self.form_schema_path.exists():
+            self._form_schema = self._load_form_schema(self.form_schema_path)
+        if browsers_path is not None:
+            # Pin Playwright's browser download cache so every run (and every
+            # worker) reuses the same Chromium install.
+            os.environ["PLAYWRIGHT_BROWSERS_PATH"] = str(browsers_path)
+        # A private generator keeps concurrent applies off the shared global
+        # ``random`` state.
+        self._random = random.Random()
+        self._playwright = None
+        self._pool: Optional[_BrowserPool] = None
+        self._pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Memoised locators per page or frame; entries go with their page.
+        self._locators: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def start_pool(self, size: int = 1, *, max_uses: int = 50) -> None:
+        """Launch ``size`` browsers that subsequent applications will reuse.
+
+        The pool is bound to the running event loop, so call this from the same
+        loop that drives :meth:`_apply_async`. Each browser is recycled after
+        ``max_uses`` applications to keep memory growth in check.
+        """
+
+        if self._pool is not None:
+            return
+        if size <= 0:
+            raise ValueError("size must be positive")
+        async_playwright, _ = _load_playwright()
+        self._playwright = await async_playwright().start()
+        playwright = self._playwright
+        pool = _BrowserPool(
+            lambda: self._launch_browser(playwright),
+            size=size,
+            max_uses=max_uses,
+            # A single application makes several page waits of up to
+            # ``timeout`` each; waiting much longer means the pool is stuck.
+            acquire_timeout=self.timeout * _POOL_ACQUIRE_TIMEOUT_FACTOR,
+        )
+        try:
+            await pool.start()
+        except Exception:
+            await pool.close()
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+        self._pool = pool
+        self._pool_loop = asyncio.get_running_loop()
+
+    async def close_pool(self) -> None:
+        """Close every pooled browser and stop the shared Playwright driver."""
+
+        pool, self._pool = self._pool, None
+        self._pool_loop = None
+        if pool is not None:
+            await pool.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @property
+    def pool_running(self) -> bool:
+        return self._pool is not None
+
+    def open_session(self, size: int = 1, *, max_uses: int = 50) -> None:
+        """Start a browser pool that synchronous :meth:`apply` calls will share.
+
+        The pool lives on the shared background loop, so a worker processing a
+        queue pays for one browser start-up instead of one per posting.
+        """
+
+        asyncio.run_coroutine_threadsafe(
+            self.start_pool(size, max_uses=max_uses), self._background_loop()
+        ).result()
+
+    def close_session(self) -> None:
+        """Shut down the pool started by :meth:`open_session`."""
+
+        loop = self._pool_loop
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.close_pool(), loop).result()
+
+    def __enter__(self) -> "DirectApplyAutomation":
+        self.open_session()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close_session()
+
+    async def __aenter__(self) -> "DirectApplyAutomation":
+        await self.start_pool()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close_pool()
+
+    async def _launch_browser(self, playwright):
+        if self.cdp_endpoint:
+            return await playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+        return await playwright.chromium.launch(
+            headless=self.headless,
+            args=list(BROWSER_LAUNCH_ARGS),
+        )
 
     def apply(
         self,
@@ -73,6 +587,10 @@ class DirectApplyAutomation:
         if not posting.apply_url:
             raise ValueError("Job posting is missing an apply URL")
 
+        if dry_run:
+            print("[dry-run] Would launch browser and submit application to", posting.apply_url)
+            return True
+
         resume_path = Path(resume_path) if resume_path else None
         cover_letter_path = Path(cover_letter_path) if cover_letter_path else None
 
@@ -81,30 +599,71 @@ class DirectApplyAutomation:
         if cover_letter_path and not cover_letter_path.exists():
             raise FileNotFoundError(f"Cover letter file does not exist: {cover_letter_path}")
 
-        if dry_run:
-            print("[dry-run] Would launch browser and submit application to", posting.apply_url)
-            return True
+        return self.submit(
+            profile,
+            posting,
+            resume_path=resume_path,
+            cover_letter_path=cover_letter_path,
+            answers=answers,
+        ).result()
 
+    def submit(
+        self,
+        profile: CandidateProfile,
+        posting: JobPosting,
+        *,
+        resume_path: Optional[Path] = None,
+        cover_letter_path: Optional[Path] = None,
+        answers: Optional[Mapping[str, str]] = None,
+    ) -> Future:
+        """Schedule an application on the long-lived automation loop.
 
-        def _runner() -> bool:
-            return asyncio.run(
-                self._apply_async(
-                    profile,
-                    posting,
-                    resume_path=resume_path,
-                    cover_letter_path=cover_letter_path,
-                    answers=answers or {},
-                )
+        Returns a :class:`concurrent.futures.Future` so callers can queue many
+        postings and collect results later. Submissions made while a session is
+        open share its browser pool.
+        """
+
+        if not posting.apply_url:
+            raise ValueError("Job posting is missing an apply URL")
+        return self._submit(
+            self._apply_async(
+                profile,
+                posting,
+                resume_path=Path(resume_path) if resume_path else None,
+                cover_letter_path=Path(cover_letter_path) if cover_letter_path else None,
+                answers=answers or {},
             )
+        )
 
+    def _submit(self, coroutine) -> Future:
+        # Browsers in the pool belong to the loop that started it, so prefer
+        # that loop while it is serving; otherwise use the shared background
+        # loop rather than paying for a fresh event loop per call.
+        loop = self._pool_loop
+        if loop is None or not loop.is_running():
+            loop = self._background_loop()
         try:
-            asyncio.get_running_loop()
+            running = asyncio.get_running_loop()
         except RuntimeError:
-            return _runner()
+            running = None
+        if running is loop:
+            coroutine.close()
+            raise RuntimeError("Blocking apply called from the automation loop; await the async API instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def _run_sync(self, coroutine):
+        """Drive ``coroutine`` to completion from synchronous code."""
+
+        return self._submit(coroutine).result()
 
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(_runner)
-            return future.result()
+    @classmethod
+    def _background_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="jobofcron-apply", daemon=True).start()
+                cls._loop = loop
+            return cls._loop
 
 
     async def _apply_async(
@@ -116,86 +675,209 @@ class DirectApplyAutomation:
         cover_letter_path: Optional[Path],
         answers: Mapping[str, str],
     ) -> bool:
-        try:
-            from playwright.async_api import TimeoutError as PlaywrightTimeoutError
-            from playwright.async_api import async_playwright
-        except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
-            raise AutomationDependencyError(
-                "Install the 'automation' optional dependency group (pip install jobofcron[automation])"
-            ) from exc
+        if self.api_submitter is not None and self.api_submitter.supports(posting.apply_url):
+            submitted = await asyncio.to_thread(
+                self.api_submitter.try_apply,
+                profile,
+                posting,
+                resume_path=resume_path,
+                cover_letter_path=cover_letter_path,
+                answers=answers,
+            )
+            if submitted:
+                return True
 
-        async with async_playwright() as playwright:
+        async_playwright, PlaywrightTimeoutError = _load_playwright()
 
-            browser = await playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-infobars",
-                    "--disable-dev-shm-usage",
-                ],
-            )
-            context = None
-            try:
-                context = await browser.new_context(
-                    user_agent=self._random_user_agent(),
-                    viewport=self._random_viewport(),
-                    locale=self.locale,
-                    timezone_id=self.timezone,
-                )
-                await context.add_init_script(
-                    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
-                )
-                await context.add_init_script("window.chrome = {runtime: {}};")
-                await context.add_init_script(
-                    "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3]});"
-                )
-                page = await context.new_page()
-                if self.enable_stealth:
-                    await self._apply_stealth(page)
+        if self._pool is None:
+            async with async_playwright() as playwright:
+                browser = await self._launch_browser(playwright)
                 try:
-                    await page.goto(
-                        posting.apply_url,
-                        wait_until="domcontentloaded",
-                        timeout=self.timeout * 1000,
-                    )
-                    handler = self._select_handler(posting.apply_url)
-                    return await handler(
-                        page,
+                    return await self._apply_with_browser(
+                        browser,
                         profile,
+                        posting,
                         resume_path=resume_path,
                         cover_letter_path=cover_letter_path,
                         answers=answers,
+                        timeout_error=PlaywrightTimeoutError,
                     )
-                except PlaywrightTimeoutError as exc:
-                    raise TimeoutError(
-                        f"Timed out while loading or submitting {posting.apply_url}"
-                    ) from exc
-            finally:
-                if context is not None:
-                    await context.close()
+                finally:
+                    await browser.close()
 
-                await browser.close()
+        browser = await self._pool.acquire()
+        try:
+            return await self._apply_with_browser(
+                browser,
+                profile,
+                posting,
+                resume_path=resume_path,
+                cover_letter_path=cover_letter_path,
+                answers=answers,
+                timeout_error=PlaywrightTimeoutError,
+            )
+        finally:
+            await self._pool.release(browser)
+
+    async def apply_many(
+        self,
+        profile: CandidateProfile,
+        postings: Sequence[JobPosting],
+        *,
+        concurrency: int = 4,
+        resume_path: Optional[Path] = None,
+        cover_letter_path: Optional[Path] = None,
+        answers: Optional[Mapping[str, str]] = None,
+    ) -> list:
+        """Apply to several postings concurrently on pooled browsers.
+
+        Returns one entry per posting, in order: the handler result or the
+        exception raised while applying. A temporary pool is started (and
+        closed afterwards) when :meth:`start_pool` has not been called.
+        """
+
+        jobs = [
+            ApplyJob(posting, resume_path=resume_path, cover_letter_path=cover_letter_path, answers=answers)
+            for posting in postings
+        ]
+        return await self.apply_jobs(profile, jobs, concurrency=concurrency)
+
+    async def apply_jobs(
+        self,
+        profile: CandidateProfile,
+        jobs: Sequence[ApplyJob],
+        *,
+        concurrency: int = 4,
+    ) -> list:
+        """Like :meth:`apply_many`, but with per-posting documents and answers."""
+
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        jobs = list(jobs)
+        if not jobs:
+            return []
+
+        owns_pool = self._pool is None
+        if owns_pool:
+            await self.start_pool(min(concurrency, len(jobs)))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(job: ApplyJob) -> bool:
+            if not job.posting.apply_url:
+                raise ValueError("Job posting is missing an apply URL")
+            async with semaphore:
+                return await self._apply_async(
+                    profile,
+                    job.posting,
+                    resume_path=Path(job.resume_path) if job.resume_path else None,
+                    cover_letter_path=Path(job.cover_letter_path) if job.cover_letter_path else None,
+                    answers=job.answers or {},
+                )
+
+        try:
+            return await asyncio.gather(*(_run(job) for job in jobs), return_exceptions=True)
+        finally:
+            if owns_pool:
+                await self.close_pool()
+
+    def apply_batch(self, profile: CandidateProfile, jobs: Sequence[ApplyJob], *, concurrency: int = 4) -> list:
+        """Synchronous entry point for :meth:`apply_jobs`."""
+
+        return self._run_sync(self.apply_jobs(profile, jobs, concurrency=concurrency))
+
+    async def _apply_with_browser(
+        self,
+        browser,
+        profile: CandidateProfile,
+        posting: JobPosting,
+        *,
+        resume_path: Optional[Path],
+        cover_letter_path: Optional[Path],
+        answers: Mapping[str, str],
+        timeout_error: type[Exception],
+    ) -> bool:
+        context = await self._new_context(browser)
+        try:
+            return await self._apply_async_with_context(
+                context,
+                profile,
+                posting,
+                resume_path=resume_path,
+                cover_letter_path=cover_letter_path,
+                answers=answers,
+                timeout_error=timeout_error,
+            )
+        finally:
+            await context.close()
+
+    async def _new_context(self, browser):
+        context = await browser.new_context(
+            user_agent=self._random_user_agent(),
+            viewport=self._random_viewport(),
+            locale=self.locale,
+            timezone_id=self.timezone,
+        )
+        try:
+            await context.add_init_script(self._INIT_SCRIPT)
+        except Exception:
+            await context.close()
+            raise
+        return context
+
+    async def _apply_async_with_context(
+        self,
+        context,
+        profile: CandidateProfile,
+        posting: JobPosting,
+        *,
+        resume_path: Optional[Path],
+        cover_letter_path: Optional[Path],
+        answers: Mapping[str, str],
+        timeout_error: type[Exception],
+    ) -> bool:
+        page = await context.new_page()
+        page.on("framenavigated", lambda frame: self._forget_locators(page, frame))
+        if self.enable_stealth:
+            await self._apply_stealth(page)
+        try:
+            # Only wait for the navigation to commit; each handler waits for
+            # the form fields it actually needs, so slow images and analytics
+            # no longer hold up the fill.
+            await page.goto(posting.apply_url, wait_until="commit", timeout=self.timeout * 1000)
+            handler = self._select_handler(posting.apply_url)
+            return await handler(
+                page,
+                profile,
+                resume_path=resume_path,
+                cover_letter_path=cover_letter_path,
+                answers=answers,
+            )
+        except timeout_error as exc:
+            raise TimeoutError(
+                f"Timed out while loading or submitting {posting.apply_url}"
+            ) from exc
+        finally:
+            self._save_form_schema()
 
     def _select_handler(self, url: str):
-        domain = urlparse(url).netloc.lower()
-        if "greenhouse.io" in domain:
-            return self._apply_greenhouse
-        if "lever.co" in domain:
-            return self._apply_lever
-
-        if "workday" in domain or "myworkdayjobs" in domain:
-            return self._apply_workday
-        if "icims.com" in domain:
-            return self._apply_icims
-        return self._apply_generic
+        return getattr(self, self._HANDLERS[_handler_key(_apply_domain(url))])
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _split_name(name: str) -> tuple[str, str]:
+        """Return the first and last space-separated tokens of ``name``."""
+
+        return name.partition(" ")[0], name.rpartition(" ")[2]
 
     def _random_user_agent(self) -> str:
         if self.user_agent:
             return self.user_agent
-        return random.choice(DEFAULT_USER_AGENTS)
+        return self._random.choice(DEFAULT_USER_AGENTS)
 
     def _random_viewport(self) -> dict:
-        return random.choice(DEFAULT_VIEWPORTS)
+        # Playwright only reads the viewport, so the shared dicts are handed
+        # over as-is without a per-context copy.
+        return self._random.choice(DEFAULT_VIEWPORTS)
 
     async def _apply_stealth(self, page) -> None:
         try:
@@ -204,48 +886,106 @@ class DirectApplyAutomation:
             stealth_async = None
         if stealth_async:
             await stealth_async(page)
-        await page.add_init_script(
-            "() => {"
-            "const navigatorProto = navigator.__proto__;"
-            "Object.defineProperty(navigatorProto, 'webdriver', { get: () => undefined });"
-            "Object.defineProperty(navigatorProto, 'languages', { get: () => ['en-US', 'en'] });"
-            "Object.defineProperty(navigatorProto, 'platform', { get: () => 'Win32' });"
-            "}"
-        )
+
+    async def _batch_fill(self, page, fields: Sequence[tuple[str, str]]) -> None:
+        """Fill several ``(selector, value)`` pairs in one round-trip.
+
+        Values go through the native setter so framework-controlled inputs see
+        the change. Selectors the script cannot resolve fall back to
+        ``page.fill``, which waits for the element as before.
+        """
+
+        try:
+            missing = await page.evaluate(self._JS_BATCH_FILL, [list(pair) for pair in fields])
+        except Exception:
+            missing = list(range(len(fields)))
+        for index in missing:
+            selector, value = fields[index]
+            await page.fill(selector, value)
+
+    def _locator(self, context, selector: str):
+        """Return a memoised locator for ``selector`` on a page or frame.
+
+        The cache for a frame is dropped whenever it navigates; see
+        :meth:`_forget_locators`.
+        """
+
+        cache = self._locators.setdefault(context, {})
+        locator = cache.get(selector)
+        if locator is None:
+            locator = cache[selector] = context.locator(selector)
+        return locator
+
+    def _forget_locators(self, page, frame) -> None:
+        self._locators.pop(frame, None)
+        if frame is page.main_frame:
+            self._locators.pop(page, None)
 
     def _all_contexts(self, page) -> Iterable:
-        yielded = set()
         yield page
-        yielded.add(id(page))
-        for frame in page.frames:
-            if id(frame) not in yielded:
-                yielded.add(id(frame))
-                yield frame
+        yield from page.frames
+
+    async def _matching_locators(self, page, selector: str) -> list:
+        """Return locators for ``selector`` in every frame that has a match.
+
+        All frames are probed concurrently so the check costs one round-trip
+        rather than one per frame.
+        """
+
+        locators = [self._locator(context, selector) for context in self._all_contexts(page)]
+        present = await asyncio.gather(*(self._has(locator) for locator in locators))
+        return [locator for locator, found in zip(locators, present) if found]
+
+    @staticmethod
+    async def _has(locator) -> bool:
+        """Return whether ``locator`` currently matches anything, in one round-trip."""
+
+        try:
+            return await locator.count() > 0
+        except Exception:
+            return False
 
     async def _fill_if_present(self, page, selector: str, value: str) -> bool:
         if not value:
             return False
-        for context in self._all_contexts(page):
+        for locator in await self._matching_locators(page, selector):
             try:
-                locator = context.locator(selector)
-                if await locator.count() > 0:
-                    await locator.first.fill(value)
-                    return True
+                await locator.first.fill(value)
+                return True
             except Exception:
                 continue
         return False
 
     async def _set_file_by_selector(self, page, selector: str, file_path: Path) -> bool:
-        for context in self._all_contexts(page):
+        for locator in await self._matching_locators(page, selector):
             try:
-                locator = context.locator(selector)
-                if await locator.count() > 0:
-                    await locator.first.set_input_files(str(file_path))
-                    return True
+                await locator.first.set_input_files(str(file_path))
+                return True
             except Exception:
                 continue
         return False
 
+    async def _any_present(self, page, selectors: Sequence[str]) -> bool:
+        # One probe for the whole selector list; fields that are absent, the
+        # common case on multi-step forms, skip the per-selector lookups.
+        return bool(await self._matching_locators(page, ", ".join(selectors)))
+
+    async def _fill_first(self, page, selectors: Sequence[str], value: str) -> bool:
+        if not value or not await self._any_present(page, selectors):
+            return False
+        for selector in selectors:
+            if await self._fill_if_present(page, selector, value):
+                return True
+        return False
+
+    async def _set_file_first(self, page, selectors: Sequence[str], file_path: Path) -> bool:
+        if not await self._any_present(page, selectors):
+            return False
+        for selector in selectors:
+            if await self._set_file_by_selector(page, selector, file_path):
+                return True
+        return False
+
 
     async def _apply_generic(
         self,
@@ -256,6 +996,9 @@ class DirectApplyAutomation:
         cover_letter_path: Optional[Path],
         answers: Mapping[str, str],
     ) -> bool:
+        await page.wait_for_selector(self._GENERIC_READY, timeout=self.timeout * 1000)
+        # Steps run one at a time: concurrent fills on one page interleave
+        # focus and key events, which some ATS forms reject.
         await self._fill_contact_info(page, profile)
         if resume_path:
             await self._upload_file(page, resume_path, keywords=("resume",))
@@ -275,20 +1018,24 @@ class DirectApplyAutomation:
         answers: Mapping[str, str],
     ) -> bool:
         await page.wait_for_selector("form", timeout=self.timeout * 1000)
-        await page.fill("input[name='first_name']", profile.name.split(" ")[0])
-        await page.fill("input[name='last_name']", profile.name.split(" ")[-1])
-        await page.fill("input[name='email']", profile.email)
+        first_name, last_name = self._split_name(profile.name)
+        fields = [
+            (self._GREENHOUSE_FIRST_NAME, first_name),
+            (self._GREENHOUSE_LAST_NAME, last_name),
+            (self._GREENHOUSE_EMAIL, profile.email),
+        ]
         if profile.phone:
-            await page.fill("input[name='phone']", profile.phone)
+            fields.append((self._GREENHOUSE_PHONE, profile.phone))
+        await self._batch_fill(page, fields)
 
         if resume_path:
             try:
-                await page.set_input_files("input[type='file'][name='resume']", str(resume_path))
+                await page.set_input_files(self._GREENHOUSE_RESUME, str(resume_path))
             except Exception:
                 await self._upload_file(page, resume_path, keywords=("resume",))
         if cover_letter_path:
             try:
-                await page.set_input_files("input[type='file'][name='cover_letter']", str(cover_letter_path))
+                await page.set_input_files(self._GREENHOUSE_COVER_LETTER, str(cover_letter_path))
             except Exception:
                 await self._upload_file(page, cover_letter_path, keywords=("cover",))
 
@@ -311,19 +1058,19 @@ class DirectApplyAutomation:
         answers: Mapping[str, str],
     ) -> bool:
         await page.wait_for_selector("form", timeout=self.timeout * 1000)
-        await page.fill("input[name='name']", profile.name)
-        await page.fill("input[name='email']", profile.email)
+        fields = [(self._LEVER_NAME, profile.name), (self._LEVER_EMAIL, profile.email)]
         if profile.phone:
-            await page.fill("input[name='phone']", profile.phone)
+            fields.append((self._LEVER_PHONE, profile.phone))
+        await self._batch_fill(page, fields)
 
         if resume_path:
             try:
-                await page.set_input_files("input[type='file'][name='resume']", str(resume_path))
+                await page.set_input_files(self._LEVER_RESUME, str(resume_path))
             except Exception:
                 await self._upload_file(page, resume_path, keywords=("resume",))
         if cover_letter_path:
             try:
-                await page.set_input_files("input[type='file'][name='coverLetter']", str(cover_letter_path))
+                await page.set_input_files(self._LEVER_COVER_LETTER, str(cover_letter_path))
             except Exception:
                 await self._upload_file(page, cover_letter_path, keywords=("cover", "letter"))
 
@@ -346,66 +1093,21 @@ class DirectApplyAutomation:
         cover_letter_path: Optional[Path],
         answers: Mapping[str, str],
     ) -> bool:
-        await page.wait_for_load_state("domcontentloaded", timeout=self.timeout * 1000)
-        first_name = profile.name.split(" ")[0]
-        last_name = profile.name.split(" ")[-1]
-
-        for selector in (
-            "input[data-automation-id='firstName']",
-            "input[name='firstName']",
-            "input[aria-label='First Name']",
-        ):
-            if await self._fill_if_present(page, selector, first_name):
-                break
-
-        for selector in (
-            "input[data-automation-id='lastName']",
-            "input[name='lastName']",
-            "input[aria-label='Last Name']",
-        ):
-            if await self._fill_if_present(page, selector, last_name):
-                break
-
-        for selector in (
-            "input[data-automation-id='email']",
-            "input[name='email']",
-            "input[aria-label='Email Address']",
-        ):
-            if await self._fill_if_present(page, selector, profile.email):
-                break
+        await page.wait_for_selector(self._ATS_READY, timeout=self.timeout * 1000)
+        first_name, last_name = self._split_name(profile.name)
 
+        await self._fill_first(page, self._WORKDAY_FIRST_NAME, first_name)
+        await self._fill_first(page, self._WORKDAY_LAST_NAME, last_name)
+        await self._fill_first(page, self._WORKDAY_EMAIL, profile.email)
         if profile.phone:
-            for selector in (
-                "input[data-automation-id='phoneNumber']",
-                "input[name='phoneNumber']",
-                "input[aria-label='Primary Phone']",
-            ):
-                if await self._fill_if_present(page, selector, profile.phone):
-                    break
+            await self._fill_first(page, self._WORKDAY_PHONE, profile.phone)
 
         if resume_path:
-            uploaded = False
-            for selector in (
-                "input[data-automation-id='resumeUploadInput']",
-                "input[data-automation-id='resumeField']",
-                "input[name='resumeUpload']",
-            ):
-                uploaded = await self._set_file_by_selector(page, selector, resume_path)
-                if uploaded:
-                    break
-            if not uploaded:
+            if not await self._set_file_first(page, self._WORKDAY_RESUME, resume_path):
                 await self._upload_file(page, resume_path, keywords=("resume", "cv"))
 
         if cover_letter_path:
-            uploaded = False
-            for selector in (
-                "input[data-automation-id='coverLetterUpload']",
-                "input[name='coverLetterUpload']",
-            ):
-                uploaded = await self._set_file_by_selector(page, selector, cover_letter_path)
-                if uploaded:
-                    break
-            if not uploaded:
+            if not await self._set_file_first(page, self._WORKDAY_COVER_LETTER, cover_letter_path):
                 await self._upload_file(page, cover_letter_path, keywords=("cover", "letter"))
 
         if answers:
@@ -423,66 +1125,21 @@ class DirectApplyAutomation:
         cover_letter_path: Optional[Path],
         answers: Mapping[str, str],
     ) -> bool:
-        await page.wait_for_load_state("domcontentloaded", timeout=self.timeout * 1000)
-        first_name = profile.name.split(" ")[0]
-        last_name = profile.name.split(" ")[-1]
-
-        for selector in (
-            "input#firstName",
-            "input[name='firstName']",
-            "input[aria-label='First Name']",
-        ):
-            if await self._fill_if_present(page, selector, first_name):
-                break
-
-        for selector in (
-            "input#lastName",
-            "input[name='lastName']",
-            "input[aria-label='Last Name']",
-        ):
-            if await self._fill_if_present(page, selector, last_name):
-                break
-
-        for selector in (
-            "input#email",
-            "input[name='email']",
-            "input[type='email']",
-        ):
-            if await self._fill_if_present(page, selector, profile.email):
-                break
+        await page.wait_for_selector(self._ATS_READY, timeout=self.timeout * 1000)
+        first_name, last_name = self._split_name(profile.name)
 
+        await self._fill_first(page, self._ICIMS_FIRST_NAME, first_name)
+        await self._fill_first(page, self._ICIMS_LAST_NAME, last_name)
+        await self._fill_first(page, self._ICIMS_EMAIL, profile.email)
         if profile.phone:
-            for selector in (
-                "input#phone",
-                "input[name='phone']",
-                "input[aria-label='Phone']",
-            ):
-                if await self._fill_if_present(page, selector, profile.phone):
-                    break
+            await self._fill_first(page, self._ICIMS_PHONE, profile.phone)
 
         if resume_path:
-            uploaded = False
-            for selector in (
-                "input#resume",
-                "input[name='resume']",
-                "input[data-testid='resume-upload']",
-            ):
-                uploaded = await self._set_file_by_selector(page, selector, resume_path)
-                if uploaded:
-                    break
-            if not uploaded:
+            if not await self._set_file_first(page, self._ICIMS_RESUME, resume_path):
                 await self._upload_file(page, resume_path, keywords=("resume", "cv"))
 
         if cover_letter_path:
-            uploaded = False
-            for selector in (
-                "input#coverLetter",
-                "input[name='coverLetter']",
-            ):
-                uploaded = await self._set_file_by_selector(page, selector, cover_letter_path)
-                if uploaded:
-                    break
-            if not uploaded:
+            if not await self._set_file_first(page, self._ICIMS_COVER_LETTER, cover_letter_path):
                 await self._upload_file(page, cover_letter_path, keywords=("cover", "letter"))
 
         if answers:
@@ -493,84 +1150,172 @@ class DirectApplyAutomation:
 
 
     async def _fill_contact_info(self, page, profile: CandidateProfile) -> None:
+        first_name, last_name = self._split_name(profile.name)
         fields = {
             "name": profile.name,
             "full name": profile.name,
-            "first name": profile.name.split(" ")[0],
-            "last name": profile.name.split(" ")[-1],
+            "first name": first_name,
+            "last name": last_name,
             "email": profile.email,
             "phone": profile.phone or "",
         }
-        for label, value in fields.items():
-            if not value:
-                continue
+        pending = [(label, value) for label, value in fields.items() if value]
 
+        # Selectors remembered from earlier postings on this board go first.
+        known = self._form_schema.get(self._form_key(page.url), {})
+        cached = [(label, value) for label, value in pending if label in known]
+        if cached:
+            try:
+                missing = set(
+                    await page.evaluate(self._JS_BATCH_FILL, [[known[label], value] for label, value in cached])
+                )
+            except Exception:
+                missing = set(range(len(cached)))
+            done = {label for index, (label, _) in enumerate(cached) if index not in missing}
+            pending = [pair for pair in pending if pair[0] not in done]
+
+        # Resolve labels and placeholders in-page first; only fields the script
+        # cannot place unambiguously go through the locator lookups below.
+        for context in self._all_contexts(page):
+            if not pending:
+                return
+            try:
+                resolved = await context.evaluate(self._JS_FILL_BY_LABEL, [list(pair) for pair in pending])
+            except Exception:
+                continue
+            if context is page:
+                for label, selector in resolved:
+                    if selector:
+                        self._remember_field(page, label, selector)
+            filled = {label for label, _ in resolved}
+            pending = [pair for pair in pending if pair[0] not in filled]
+
+        for label, value in pending:
             for context in self._all_contexts(page):
                 locator = context.get_by_label(label, exact=False)
                 try:
-                    if await locator.count() > 0:
+                    if await self._has(locator):
                         await locator.fill(value)
                         break
                 except Exception:
                     pass
                 placeholder_locator = context.get_by_placeholder(label, exact=False)
                 try:
-                    if await placeholder_locator.count() > 0:
+                    if await self._has(placeholder_locator):
                         await placeholder_locator.fill(value)
                         break
                 except Exception:
                     continue
 
+    @staticmethod
+    def _form_key(url: str) -> str:
+        parsed = urlparse(url)
+        board = parsed.path.strip("/").partition("/")[0]
+        return f"{parsed.netloc.lower()}/{board}"
+
+    @staticmethod
+    def _load_form_schema(path: Path) -> dict[str, dict[str, str]]:
+        # The schema is only a cache, so a damaged file means starting over
+        # rather than refusing to run.
+        try:
+            schema = read_json(path)
+        except (OSError, ValueError) as exc:
+            print(f"Ignoring unreadable form schema {path}: {exc}")
+            return {}
+        if not isinstance(schema, dict) or not all(isinstance(fields, dict) for fields in schema.values()):
+            print(f"Ignoring form schema {path}: expected an object of per-board selectors")
+            return {}
+        return schema
+
+    def _remember_field(self, page, slot: str, selector: str) -> None:
+        fields = self._form_schema.setdefault(self._form_key(page.url), {})
+        if fields.get(slot) != selector:
+            fields[slot] = selector
+            self._form_schema_dirty = True
+
+    def _save_form_schema(self) -> None:
+        """Persist newly discovered selectors once per application."""
+
+        if self.form_schema_path is None or not self._form_schema_dirty:
+            return
+        self._form_schema_dirty = False
+        write_json(self.form_schema_path, self._form_schema)
+
     async def _upload_file(self, page, file_path: Path, *, keywords: tuple[str, ...]) -> None:
+        slot = keywords[0]
+        cached = self._form_schema.get(self._form_key(page.url), {}).get(slot)
+        if cached and await self._set_file_by_selector(page, cached, file_path):
+            return
+
         for context in self._all_contexts(page):
-            file_inputs = context.locator("input[type='file']")
-            count = await file_inputs.count()
-            for index in range(count):
-                input_el = file_inputs.nth(index)
-                name_attr = (await input_el.get_attribute("name") or "").lower()
+            file_inputs = self._locator(context, "input[type='file']")
+            names = await file_inputs.evaluate_all(self._JS_INPUT_NAMES)
+            for index, name_attr in enumerate(names):
                 if any(keyword in name_attr for keyword in keywords) or not name_attr:
-                    await input_el.set_input_files(str(file_path))
+                    await file_inputs.nth(index).set_input_files(str(file_path))
+                    if name_attr and "'" not in name_attr:
+                        self._remember_field(page, slot, f"input[type='file'][name='{name_attr}' i]")
                     return
-            if count:
+            if names:
                 await file_inputs.first.set_input_files(str(file_path))
                 return
 
     async def _answer_questions(self, page, answers: Mapping[str, str]) -> None:
+        contexts = list(self._all_contexts(page))
+        textboxes = [self._locator(context, "input[type='text'], textarea") for context in contexts]
+        # Placeholders are read once per frame and reused for every keyword.
+        placeholders: dict[int, list[str]] = {}
         for keyword, response in answers.items():
-            for context in self._all_contexts(page):
+            needle = keyword.lower()
+            for position, context in enumerate(contexts):
                 locator = context.get_by_label(keyword, exact=False)
                 try:
-                    if await locator.count() > 0:
+                    if await self._has(locator):
                         await locator.fill(response)
                         break
                 except Exception:
                     pass
 
-                textboxes = context.locator("input[type='text'], textarea")
-                count = await textboxes.count()
-                for index in range(count):
-                    box = textboxes.nth(index)
-                    placeholder = (await box.get_attribute("placeholder") or "").lower()
-                    if keyword.lower() in placeholder:
-                        await box.fill(response)
+                if position not in placeholders:
+                    placeholders[position] = await textboxes[position].evaluate_all(self._JS_PLACEHOLDERS)
+                for index, placeholder in enumerate(placeholders[position]):
+                    if needle in placeholder:
+                        await textboxes[position].nth(index).fill(response)
                         break
 
     async def _submit_application(self, page) -> bool:
-        for context in self._all_contexts(page):
-            buttons = context.locator("button, input[type='submit']")
-            count = await buttons.count()
-            for index in range(count):
-                button = buttons.nth(index)
-                text = ""
-                try:
-                    text = (await button.inner_text()).strip().lower()
-                except Exception:
-                    attr = await button.get_attribute("value")
-                    if attr:
-                        text = attr.strip().lower()
-                if any(trigger in text for trigger in ("submit", "apply", "send", "next")):
+        cached = self._form_schema.get(self._form_key(page.url), {}).get("submit")
+        if cached:
+            locator = self._locator(page, cached)
+            try:
+                if await self._has(locator):
+                    await locator.first.click()
+                    return True
+            except Exception:
+                pass
+
+        # Let the browser resolve the trigger words in one selector first; the
+        # label scan below only runs when nothing matched or clicking failed.
+        main = self._locator(page, self._SUBMIT_SELECTOR)
+        for locator in await self._matching_locators(page, self._SUBMIT_SELECTOR):
+            try:
+                selector = await locator.first.evaluate(self._JS_STABLE_SELECTOR) if locator is main else None
+                await locator.first.click()
+            except Exception:
+                continue
+            if selector:
+                self._remember_field(page, "submit", selector)
+            return True
+
+        for buttons in await self._matching_locators(page, "button, input[type='submit']"):
+            try:
+                labels = await buttons.evaluate_all(self._JS_BUTTON_LABELS)
+            except Exception:
+                continue
+            for index, text in enumerate(labels):
+                if self._SUBMIT_RE.search(text):
                     try:
-                        await button.click()
+                        await buttons.nth(index).click()
                         return True
                     except Exception:
                         continue
@@ -578,6 +1323,61 @@ class DirectApplyAutomation:
         return False
 
 
+@dataclass
+class EmailJob:
+    """A single email application to send in a batch."""
+
+    profile: CandidateProfile
+    posting: JobPosting
+    resume_path: Optional[Path] = None
+    cover_letter_path: Optional[Path] = None
+    body_text: Optional[str] = None
+
+
+_ATTACHMENT_CHUNK = 57 * 1024
+
+
+@lru_cache(maxsize=8192)
+def _parse_mailto(url: str) -> tuple[str, Optional[str]]:
+    """Return ``(address, subject)`` from a ``mailto:`` URL."""
+
+    address, _, query = url[len("mailto:"):].partition("#")[0].partition("?")
+    for param in query.split("&") if query else ():
+        key, _, value = param.partition("=")
+        if unquote_plus(key) == "subject" and value:
+            return address, unquote_plus(value)
+    return address, None
+
+
+@lru_cache(maxsize=32)
+def _attachment_part(path: str, mtime_ns: int, size: int) -> EmailMessage:
+    """Return a ready-to-attach MIME part for ``path``, built once per file version."""
+
+    part = EmailMessage()
+    part["Content-Type"] = "application/octet-stream"
+    part["Content-Transfer-Encoding"] = "base64"
+    part.add_header("Content-Disposition", "attachment", filename=Path(path).name)
+    part.set_payload(_encoded_attachment(path, mtime_ns, size))
+    return part
+
+
+@lru_cache(maxsize=32)
+def _encoded_attachment(path: str, mtime_ns: int, size: int) -> str:
+    """Return the base64 body for an attachment.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key so edits to the
+    file invalidate the cached encoding.
+    """
+
+    # Encoding in multiples of 57 bytes yields whole 76-character lines, so the
+    # chunks concatenate cleanly without holding the raw file in memory.
+    chunks = []
+    with open(path, "rb") as handle:
+        while chunk := handle.read(_ATTACHMENT_CHUNK):
+            chunks.append(base64.encodebytes(chunk).decode("ascii"))
+    return "".join(chunks)
+
+
 class EmailApplicationSender:
     """Send job applications via SMTP using resume and cover letter attachments."""
 
@@ -599,21 +1399,51 @@ class EmailApplicationSender:
         self.from_address = from_address
         self.use_tls = use_tls
         self.use_ssl = use_ssl
+        # One TLS context (and its loaded CA bundle) shared by every connection.
+        self._ssl_context = ssl.create_default_context()
+        self._connection: Optional[smtplib.SMTP] = None
+        self._session_depth = 0
+
+    def __enter__(self) -> "EmailApplicationSender":
+        """Keep one SMTP session open for every ``send`` inside the block.
+
+        The connection is opened lazily on the first send, so entering the
+        block costs nothing when there turns out to be nothing to email. The
+        shared session is not thread-safe; use :meth:`send_parallel` for
+        concurrent delivery.
+        """
+
+        self._session_depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._session_depth -= 1
+        if self._session_depth == 0 and self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._disconnect(connection)
 
     def _resolve_recipient(self, posting: JobPosting) -> tuple[Optional[str], Optional[str]]:
         email = posting.contact_email
         subject = None
         if posting.apply_url and posting.apply_url.startswith("mailto:"):
-            parsed = urlparse(posting.apply_url)
+            address, subject = _parse_mailto(posting.apply_url)
             if not email:
-                email = parsed.path
-            if parsed.query:
-                params = parse_qs(parsed.query)
-                if "subject" in params:
-                    subject = params["subject"][0]
+                email = address
         return email, subject
 
-    def send(
+    @staticmethod
+    def _attach_file(message: EmailMessage, path: Path) -> None:
+        """Attach ``path`` using a base64 body shared across sends of the same file."""
+
+        stat = path.stat()
+        # Shallow copy so each message owns its part while sharing the
+        # prebuilt headers and encoded payload.
+        part = copy.copy(_attachment_part(str(path), stat.st_mtime_ns, stat.st_size))
+        if message.get_content_type() != "multipart/mixed":
+            message.make_mixed()
+        message.attach(part)
+
+    def _build_message(
         self,
         profile: CandidateProfile,
         posting: JobPosting,
@@ -621,11 +1451,10 @@ class EmailApplicationSender:
         resume_path: Optional[Path] = None,
         cover_letter_path: Optional[Path] = None,
         body_text: Optional[str] = None,
-        dry_run: bool = False,
-    ) -> bool:
+    ) -> Optional[EmailMessage]:
         recipient, subject_hint = self._resolve_recipient(posting)
         if not recipient:
-            return False
+            return None
 
         subject = subject_hint or f"Application for {posting.title} - {profile.name}"
         body = body_text
@@ -644,39 +1473,213 @@ class EmailApplicationSender:
         message.set_content(body)
 
         if resume_path and resume_path.exists():
-            message.add_attachment(
-                resume_path.read_bytes(),
-                maintype="application",
-                subtype="octet-stream",
-                filename=resume_path.name,
-            )
+            self._attach_file(message, resume_path)
         if cover_letter_path and cover_letter_path.exists():
-            message.add_attachment(
-                cover_letter_path.read_bytes(),
-                maintype="application",
-                subtype="octet-stream",
-                filename=cover_letter_path.name,
-            )
+            self._attach_file(message, cover_letter_path)
+        return message
 
-        if dry_run:
-            print(f"[dry-run] Would email {recipient} via SMTP server {self.host}:{self.port}")
-            return True
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated session."""
 
         if self.use_ssl:
-            connection = smtplib.SMTP_SSL(self.host, self.port, timeout=30)
+            connection = smtplib.SMTP_SSL(self.host, self.port, timeout=30, context=self._ssl_context)
         else:
             connection = smtplib.SMTP(self.host, self.port, timeout=30)
             if self.use_tls:
-                connection.starttls()
+                connection.starttls(context=self._ssl_context)
 
         try:
             if self.username and self.password:
                 connection.login(self.username, self.password)
+        except Exception:
+            self._disconnect(connection)
+            raise
+        return connection
+
+    @staticmethod
+    def _disconnect(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def send(
+        self,
+        profile: CandidateProfile,
+        posting: JobPosting,
+        *,
+        resume_path: Optional[Path] = None,
+        cover_letter_path: Optional[Path] = None,
+        body_text: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> bool:
+        message = self._build_message(
+            profile,
+            posting,
+            resume_path=resume_path,
+            cover_letter_path=cover_letter_path,
+            body_text=body_text,
+        )
+        if message is None:
+            return False
+
+        if dry_run:
+            print(f"[dry-run] Would email {message['To']} via SMTP server {self.host}:{self.port}")
+            return True
+
+        if self._session_depth:
+            if self._connection is None:
+                self._connection = self._connect()
+            try:
+                self._connection.send_message(message)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped an idle session; reconnect once and retry.
+                self._connection = self._connect()
+                self._connection.send_message(message)
+            return True
+
+        connection = self._connect()
+        try:
             connection.send_message(message)
         finally:
-            try:
-                connection.quit()
-            except Exception:
-                connection.close()
+            self._disconnect(connection)
 
         return True
+
+    def send_many(
+        self,
+        jobs: Iterable[EmailJob],
+        *,
+        max_per_connection: int = 1000,
+        rate_limit_per_sec: Optional[float] = None,
+        dry_run: bool = False,
+    ) -> list:
+        """Send several applications over as few SMTP sessions as possible.
+
+        One connection (TLS handshake and login included) is reused for up to
+        ``max_per_connection`` messages before it is recycled, which keeps
+        providers with per-session caps happy. ``rate_limit_per_sec`` spaces
+        messages out. Returns one entry per job, in order: the ``send`` result
+        or the exception raised for that job.
+        """
+
+        if max_per_connection <= 0:
+            raise ValueError("max_per_connection must be positive")
+        delay = 1 / rate_limit_per_sec if rate_limit_per_sec else 0.0
+
+        results: list = []
+        connection: Optional[smtplib.SMTP] = None
+        sent_on_connection = 0
+        try:
+            for job in jobs:
+                try:
+                    message = self._build_message(
+                        job.profile,
+                        job.posting,
+                        resume_path=job.resume_path,
+                        cover_letter_path=job.cover_letter_path,
+                        body_text=job.body_text,
+                    )
+                    if message is None:
+                        results.append(False)
+                        continue
+                    if dry_run:
+                        print(f"[dry-run] Would email {message['To']} via SMTP server {self.host}:{self.port}")
+                        results.append(True)
+                        continue
+
+                    if connection is not None and sent_on_connection >= max_per_connection:
+                        self._disconnect(connection)
+                        connection = None
+                    if connection is None:
+                        connection = self._connect()
+                        sent_on_connection = 0
+                    elif delay:
+                        time.sleep(delay)
+                    connection.send_message(message)
+                    sent_on_connection += 1
+                    results.append(True)
+                except smtplib.SMTPServerDisconnected as exc:
+                    connection = None
+                    results.append(exc)
+                except Exception as exc:
+                    results.append(exc)
+        finally:
+            if connection is not None:
+                self._disconnect(connection)
+        return results
+
+    def send_parallel(
+        self,
+        jobs: Iterable[EmailJob],
+        *,
+        workers: int = 8,
+        max_per_connection: int = 1000,
+        max_connections: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> list:
+        """Send a batch over several SMTP sessions in parallel threads.
+
+        Each worker thread keeps its own connection open across the jobs it
+        handles and recycles it after ``max_per_connection`` messages.
+        ``max_connections`` caps the worker count for providers that limit
+        concurrent sessions. Results mirror :meth:`send_many`.
+        """
+
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        if max_per_connection <= 0:
+            raise ValueError("max_per_connection must be positive")
+        if max_connections:
+            workers = min(workers, max_connections)
+
+        local = threading.local()
+        opened: list = []
+        lock = threading.Lock()
+
+        def _drop_connection() -> None:
+            connection = getattr(local, "connection", None)
+            local.connection = None
+            if connection is not None:
+                with lock:
+                    opened.remove(connection)
+                self._disconnect(connection)
+
+        def _send_one(job: EmailJob):
+            try:
+                message = self._build_message(
+                    job.profile,
+                    job.posting,
+                    resume_path=job.resume_path,
+                    cover_letter_path=job.cover_letter_path,
+                    body_text=job.body_text,
+                )
+                if message is None:
+                    return False
+                if dry_run:
+                    print(f"[dry-run] Would email {message['To']} via SMTP server {self.host}:{self.port}")
+                    return True
+
+                if getattr(local, "connection", None) is not None and local.sent >= max_per_connection:
+                    _drop_connection()
+                if getattr(local, "connection", None) is None:
+                    connection = self._connect()
+                    with lock:
+                        opened.append(connection)
+                    local.connection = connection
+                    local.sent = 0
+                local.connection.send_message(message)
+                local.sent += 1
+                return True
+            except smtplib.SMTPServerDisconnected as exc:
+                _drop_connection()
+                return exc
+            except Exception as exc:
+                return exc
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_send_one, jobs))
+        finally:
+            for connection in opened:
+                self._disconnect(connection)
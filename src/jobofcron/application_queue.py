@@ -1,15 +1,18 @@
 """Utilities for managing queued job applications."""
 from __future__ import annotations
 
+import heapq
+import itertools
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
-from .job_matching import JobPosting
+from .job_matching import JobPosting, normalise_text
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class QueuedApplication:
     """Metadata for an application to execute at a future time."""
 
@@ -27,6 +30,13 @@ class QueuedApplication:
     last_error: Optional[str] = None
     outcome: Optional[str] = None
     outcome_recorded_at: Optional[datetime] = None
+    # Set by the owning ApplicationQueue so status and schedule changes keep
+    # its indexes current. Excluded from init, repr, comparison and to_dict.
+    _queue: Optional["ApplicationQueue"] = field(default=None, init=False, repr=False, compare=False)
+
+    def _notify_queue(self) -> None:
+        if self._queue is not None:
+            self._queue._reindex(self)
 
     @property
     def job_id(self) -> str:
@@ -35,32 +45,38 @@ class QueuedApplication:
         return f"{self.posting.title}@{self.posting.company}"
 
     def mark_success(self) -> None:
+        now = datetime.now()
         self.status = "applied"
         self.attempts += 1
         self.last_error = None
-        self.notes.append(f"Applied successfully on {datetime.now().isoformat(timespec='seconds')}")
+        self.notes.append(f"Applied successfully on {now.isoformat(timespec='seconds')}")
         self.outcome = "applied"
-        self.outcome_recorded_at = datetime.now()
+        self.outcome_recorded_at = now
+        self._notify_queue()
 
     def mark_failure(self, error: str) -> None:
         self.status = "pending"
         self.attempts += 1
         self.last_error = error
         self.notes.append(f"Attempt failed on {datetime.now().isoformat(timespec='seconds')}: {error}")
+        self._notify_queue()
 
     def defer(self, new_time: datetime) -> None:
         self.apply_at = new_time
+        self._notify_queue()
 
     def record_outcome(self, outcome: str, *, note: Optional[str] = None) -> None:
         outcome_normalised = outcome.strip().lower()
-        timestamp = datetime.now().isoformat(timespec="seconds")
+        now = datetime.now()
+        timestamp = now.isoformat(timespec="seconds")
         self.outcome = outcome_normalised
-        self.outcome_recorded_at = datetime.now()
+        self.outcome_recorded_at = now
         self.status = outcome_normalised
         base_note = f"Outcome recorded ({outcome_normalised}) on {timestamp}."
         self.notes.append(base_note)
         if note and note.strip():
             self.notes.append(note.strip())
+        self._notify_queue()
 
     def to_dict(self) -> dict:
         return {
@@ -129,13 +145,96 @@ class QueuedApplication:
         )
 
 
-@dataclass
 class ApplicationQueue:
-    """Collection helper with convenience methods for queue operations."""
+    """Collection helper with convenience methods for queue operations.
+
+    Applications are indexed by ``job_id`` and pending ones are kept in a
+    min-heap keyed on ``apply_at``, so ``get`` is O(1) and ``due`` only visits
+    entries that are actually due. Heap entries are invalidated lazily: an
+    application that is rescheduled or changes status re-registers itself and
+    the outdated entry is discarded when it surfaces.
+
+    Normalised apply URLs and ``(title, company)`` pairs are indexed as well,
+    so ``find_matching`` is a pair of dictionary lookups.
+    """
+
+    __slots__ = ("_by_id", "_pending", "_heap", "_counter", "_by_url", "_by_role", "_index_keys")
+
+    def __init__(self, items: Optional[Iterable[QueuedApplication]] = None) -> None:
+        self._by_id: Dict[str, QueuedApplication] = {}
+        self._pending: Dict[str, None] = {}
+        self._heap: List[tuple[datetime, int, str]] = []
+        self._counter = itertools.count()
+        self._by_url: Dict[str, Dict[str, None]] = {}
+        self._by_role: Dict[tuple[str, str], Dict[str, None]] = {}
+        # job_id -> (url key, role key, insertion sequence)
+        self._index_keys: Dict[str, tuple[Optional[str], Optional[tuple[str, str]], int]] = {}
+        for application in items or []:
+            self._insert(application)
+
+    def __repr__(self) -> str:
+        return f"ApplicationQueue(items={self.items!r})"
+
+    @property
+    def items(self) -> List[QueuedApplication]:
+        return list(self._by_id.values())
+
+    def _insert(self, application: QueuedApplication) -> None:
+        # Re-inserting moves the entry to the end, matching list append order.
+        job_id = application.job_id
+        self._by_id.pop(job_id, None)
+        self._unindex_posting(job_id)
+        self._by_id[job_id] = application
+        self._index_posting(job_id, application.posting)
+        application._queue = self
+        self._reindex(application)
+
+    def _posting_keys(self, posting: JobPosting) -> tuple[Optional[str], Optional[tuple[str, str]]]:
+        title = self._normalise_text(posting.title)
+        company = self._normalise_text(posting.company)
+        return self._normalise_url(posting.apply_url), (title, company) if title and company else None
+
+    def _index_posting(self, job_id: str, posting: JobPosting) -> None:
+        url_key, role_key = self._posting_keys(posting)
+        if url_key:
+            self._by_url.setdefault(url_key, {})[job_id] = None
+        if role_key:
+            self._by_role.setdefault(role_key, {})[job_id] = None
+        self._index_keys[job_id] = (url_key, role_key, next(self._counter))
+
+    def _unindex_posting(self, job_id: str) -> None:
+        keys = self._index_keys.pop(job_id, None)
+        if keys is None:
+            return
+        for index, key in ((self._by_url, keys[0]), (self._by_role, keys[1])):
+            if key is None:
+                continue
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(job_id, None)
+                if not bucket:
+                    del index[key]
 
-    items: List[QueuedApplication] = field(default_factory=list)
+    def _reindex(self, application: QueuedApplication) -> None:
+        job_id = application.job_id
+        if self._by_id.get(job_id) is not application:
+            return
+        if application.status != "pending":
+            self._pending.pop(job_id, None)
+            return
+        self._pending[job_id] = None
+        heapq.heappush(self._heap, (application.apply_at, next(self._counter), job_id))
+        if len(self._heap) > 2 * len(self._by_id) + 32:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [
+            (self._by_id[job_id].apply_at, next(self._counter), job_id) for job_id in self._pending
+        ]
+        heapq.heapify(self._heap)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalise_url(url: Optional[str]) -> Optional[str]:
         if not url:
             return None
@@ -147,58 +246,70 @@ class ApplicationQueue:
             return None
         return f"{netloc}{path}{query}" or None
 
-    @staticmethod
-    def _normalise_text(value: Optional[str]) -> str:
-        if not value:
-            return ""
-        return " ".join(value.strip().lower().split())
+    _normalise_text = staticmethod(normalise_text)
 
     def find_matching(self, posting: JobPosting) -> Optional[QueuedApplication]:
-        target_url = self._normalise_url(posting.apply_url)
-        target_title = self._normalise_text(posting.title)
-        target_company = self._normalise_text(posting.company)
-        for application in self.items:
-            other = application.posting
-            other_url = self._normalise_url(other.apply_url)
-            if target_url and other_url and target_url == other_url:
-                return application
-            if (
-                target_title
-                and target_company
-                and target_title == self._normalise_text(other.title)
-                and target_company == self._normalise_text(other.company)
-            ):
-                return application
-        return None
+        url_key, role_key = self._posting_keys(posting)
+        candidates = []
+        if url_key and url_key in self._by_url:
+            candidates.append(next(iter(self._by_url[url_key])))
+        if role_key and role_key in self._by_role:
+            candidates.append(next(iter(self._by_role[role_key])))
+        if not candidates:
+            return None
+        # Prefer the earliest queued entry, as a front-to-back scan would.
+        job_id = min(candidates, key=lambda candidate: self._index_keys[candidate][2])
+        return self._by_id[job_id]
 
     def add(self, application: QueuedApplication) -> None:
         existing = self.find_matching(application.posting)
-        if existing and existing.job_id != application.job_id:
+        if not existing or existing.job_id == application.job_id:
+            existing = self.get(application.job_id)
+        if existing:
             application.notes = existing.notes + application.notes
             application.attempts = existing.attempts
             application.last_error = existing.last_error
-            self.items = [app for app in self.items if app.job_id != existing.job_id]
-        else:
-            existing = self.get(application.job_id)
-            if existing:
-                application.notes = existing.notes + application.notes
-                application.attempts = existing.attempts
-                application.last_error = existing.last_error
-                self.items = [app for app in self.items if app.job_id != application.job_id]
-        self.items.append(application)
+            self.remove(existing.job_id)
+        self._insert(application)
+
+    def remove(self, job_id: str) -> Optional[QueuedApplication]:
+        """Drop an application from the queue, returning it if it was present."""
+
+        application = self._by_id.pop(job_id, None)
+        self._pending.pop(job_id, None)
+        self._unindex_posting(job_id)
+        if application is not None and application._queue is self:
+            application._queue = None
+        return application
 
     def get(self, job_id: str) -> Optional[QueuedApplication]:
-        for application in self.items:
-            if application.job_id == job_id:
-                return application
-        return None
+        return self._by_id.get(job_id)
 
     def due(self, when: datetime) -> List[QueuedApplication]:
-        pending = [app for app in self.items if app.status == "pending" and app.apply_at <= when]
-        return sorted(pending, key=lambda app: app.apply_at)
+        ready: List[QueuedApplication] = []
+        live: List[tuple[datetime, int, str]] = []
+        seen: set[str] = set()
+        while self._heap and self._heap[0][0] <= when:
+            entry = heapq.heappop(self._heap)
+            apply_at, _, job_id = entry
+            application = self._by_id.get(job_id)
+            if (
+                application is None
+                or job_id in seen
+                or application.status != "pending"
+                or application.apply_at != apply_at
+            ):
+                continue
+            seen.add(job_id)
+            ready.append(application)
+            live.append(entry)
+        # ``due`` does not consume entries; put the live ones back.
+        for entry in live:
+            heapq.heappush(self._heap, entry)
+        return ready
 
     def pending(self) -> List[QueuedApplication]:
-        return [app for app in self.items if app.status == "pending"]
+        return [self._by_id[job_id] for job_id in self._pending]
 
     def to_snapshot(self) -> List[dict]:
         return [app.to_dict() for app in self.items]
@@ -218,4 +329,18 @@ class ApplicationQueue:
                     notes=[f"Could not load entry: {exc}"],
                 )
                 items.append(broken)
-        return cls(items=items)
+        # Job ids are the queue's key. Keep the first entry for a repeated id,
+        # which is the one ``get`` returned before the queue was indexed, and
+        # record the dropped entries on it, as malformed entries are recorded.
+        unique: Dict[str, QueuedApplication] = {}
+        for application in items:
+            kept = unique.get(application.job_id)
+            if kept is None:
+                unique[application.job_id] = application
+                continue
+            kept.notes.extend(application.notes)
+            kept.notes.append(
+                f"Dropped duplicate queue entry for {application.posting.title} at "
+                f"{application.posting.company} (status: {application.status})"
+            )
+        return cls(items=unique.values())
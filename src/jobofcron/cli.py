@@ -2,14 +2,15 @@
 from __future__ import annotations
 
 import argparse
-import json
+import heapq
 import os
-from dataclasses import asdict
+import re
+import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
-from .application_automation import AutomationDependencyError, DirectApplyAutomation, EmailApplicationSender
 from .application_queue import ApplicationQueue, QueuedApplication
 from .document_generation import (
     AIDocumentGenerator,
@@ -19,13 +20,27 @@ from .document_generation import (
     generate_resume,
 )
 from .job_history import AppliedJobRegistry
-from .job_matching import JobPosting, analyse_job_fit
-from .job_search import CraigslistSearch, GoogleJobSearch
+from .job_matching import JobPosting, analyse_job_fit, analyse_job_fits, normalise_text
 from .profile import CandidateProfile
-from .scheduler import plan_schedule
 from .skills_inventory import SkillsInventory
-from .storage import Storage
-from .worker import JobAutomationWorker
+from .storage import (
+    Storage,
+    StorageDependencyError,
+    iter_json_array,
+    read_json,
+    write_json,
+    write_text_atomic,
+)
+
+try:  # pragma: no cover - optional dependency
+    import ahocorasick
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+# Automation, search and worker modules pull in requests, asyncio and smtplib,
+# so the commands that need them import them on demand.
+if TYPE_CHECKING:  # pragma: no cover - annotations only
+    from .application_automation import ApiApplySubmitter, EmailApplicationSender
 
 DEFAULT_STORAGE = Path("jobofcron_data.json")
 
@@ -33,31 +48,113 @@ DEFAULT_STORAGE = Path("jobofcron_data.json")
 AI_PROVIDER_CHOICES = AIDocumentGenerator.available_providers()
 AI_PROMPT_CHOICES = AIDocumentGenerator.available_prompt_styles()
 
+_PROFILE_TEMPLATE = (
+    "Profile:\n"
+    "  Name: {name}\n"
+    "  Email: {email}\n"
+    "{optional}"
+    "  Skills:\n"
+    "{skills}"
+    "  Preferences:\n"
+    "    Min salary: {min_salary}\n"
+    "    Locations: {locations}\n"
+    "    Domains: {domains}\n"
+    "    Felon friendly only: {felon_friendly_only}\n"
+    "    Blacklist: {blacklist}"
+)
+
+
+# (assessment attribute, heading, flag whose True value triggers the fallback, fallback line)
+_ANALYZE_SECTIONS = (
+    ("recommended_questions", "Questions to clarify:", None, None),
+    ("recommended_profile_updates", "Resume/Cover letter focus:", None, None),
+    (
+        "salary_notes",
+        "Salary notes:",
+        "meets_salary",
+        "Posting appears to meet your minimum salary preference.",
+    ),
+    (
+        "location_notes",
+        "Location notes:",
+        "meets_location",
+        "Posting aligns with your saved location preferences.",
+    ),
+)
+
+
+
+_SLUG_STRIP = re.compile(r"[^\w-]+")
 
 
 def slugify(*parts: str) -> str:
     token = "-".join(part.strip().lower().replace(" ", "-") for part in parts if part)
-    cleaned = [ch for ch in token if ch.isalnum() or ch in {"-", "_"}]
-    return "".join(cleaned) or "application"
+    return _SLUG_STRIP.sub("", token) or "application"
+
+
+# Blacklists at least this long are matched with an Aho-Corasick automaton
+# when pyahocorasick is installed; a regex alternation retries every entry at
+# each position of the text.
+_AUTOMATON_MIN_TERMS = 64
+
+
+class _AutomatonPattern:
+    """Minimal ``re.Pattern`` stand-in backed by an Aho-Corasick automaton."""
+
+    __slots__ = ("_automaton",)
 
+    def __init__(self, tokens: Iterable[str]) -> None:
+        self._automaton = ahocorasick.Automaton()
+        for token in tokens:
+            self._automaton.add_word(token, token)
+        self._automaton.make_automaton()
 
-def _normalise_term(value: Optional[str]) -> str:
-    if not value:
-        return ""
-    return " ".join(value.strip().lower().split())
+    def search(self, text: str) -> bool:
+        return next(self._automaton.iter(text), None) is not None
+
+
+@lru_cache(maxsize=64)
+def _blacklist_pattern(
+    blacklist: tuple[str, ...],
+) -> Optional[re.Pattern[str] | _AutomatonPattern]:
+    """Compile the normalised blacklist entries into one literal matcher."""
+
+    tokens = dict.fromkeys(token for token in map(normalise_text, blacklist) if token)
+    if not tokens:
+        return None
+    if ahocorasick is not None and len(tokens) >= _AUTOMATON_MIN_TERMS:
+        return _AutomatonPattern(tokens)
+    return re.compile("|".join(map(re.escape, tokens)))
 
 
 def _matches_blacklist(value: Optional[str], blacklist: List[str]) -> bool:
-    target = _normalise_term(value)
-    if not target:
+    return _blacklist_hit(_blacklist_pattern(tuple(blacklist)), value)
+
+
+def _blacklist_hit(
+    pattern: Optional[re.Pattern[str] | _AutomatonPattern], *values: Optional[str]
+) -> bool:
+    """Return True when any value matches a pattern from :func:`_blacklist_pattern`."""
+
+    if pattern is None:
         return False
-    for entry in blacklist:
-        token = _normalise_term(entry)
-        if token and token in target:
-            return True
-    return False
+    search = pattern.search
+    return any(search(target) for target in map(normalise_text, values) if target)
+
 
+@lru_cache(maxsize=32)
+def _read_text_version(path: str, mtime_ns: int, size: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
 
+
+def _read_text_cached(path: str) -> str:
+    """Read a template file, reusing the text until the file changes on disk."""
+
+    stat = os.stat(path)
+    return _read_text_version(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=512)
 def parse_iso_datetime(value: str) -> datetime:
     try:
         return datetime.fromisoformat(value)
@@ -69,7 +166,10 @@ def load_or_init(
     storage_path: Path,
 ) -> tuple[CandidateProfile, SkillsInventory, ApplicationQueue, AppliedJobRegistry, Storage]:
     storage = Storage(storage_path)
-    profile, inventory, queue, history = storage.load()
+    try:
+        profile, inventory, queue, history = storage.load()
+    except StorageDependencyError as exc:
+        raise SystemExit(str(exc)) from exc
 
     if profile is None:
         profile = CandidateProfile(name="Unknown", email="unknown@example.com")
@@ -89,23 +189,38 @@ def save_and_exit(
     history: AppliedJobRegistry,
     storage: Storage,
 ) -> None:
-    storage.save(profile, inventory, queue, history)
+    try:
+        storage.save_if_dirty(profile, inventory, queue, history)
+    except StorageDependencyError as exc:
+        raise SystemExit(str(exc)) from exc
+
+
+_TRUTHY = frozenset({"1", "true", "yes"})
 
 
 def build_email_sender_from_args(args: argparse.Namespace) -> Optional[EmailApplicationSender]:
-    host = getattr(args, "email_host", None) or os.getenv("JOBOFCRON_SMTP_HOST")
+    # ``args`` comes from a subcommand built with ``_email_arguments`` so every
+    # ``email_*`` attribute is present.
+    env = os.environ
+    host = args.email_host or env.get("JOBOFCRON_SMTP_HOST")
     if not host:
         return None
 
-    port = getattr(args, "email_port", None) or os.getenv("JOBOFCRON_SMTP_PORT")
+    from .application_automation import EmailApplicationSender
+
+    port = args.email_port or env.get("JOBOFCRON_SMTP_PORT")
     port_int = int(port) if port else 587
 
-    username = getattr(args, "email_username", None) or os.getenv("JOBOFCRON_SMTP_USERNAME")
-    password = getattr(args, "email_password", None) or os.getenv("JOBOFCRON_SMTP_PASSWORD")
-    from_address = getattr(args, "email_from", None) or os.getenv("JOBOFCRON_SMTP_FROM")
+    username = args.email_username or env.get("JOBOFCRON_SMTP_USERNAME")
+    password = args.email_password or env.get("JOBOFCRON_SMTP_PASSWORD")
+    from_address = args.email_from or env.get("JOBOFCRON_SMTP_FROM")
 
-    use_ssl = bool(getattr(args, "email_use_ssl", False) or os.getenv("JOBOFCRON_SMTP_USE_SSL", "").lower() in {"1", "true", "yes"})
-    disable_tls = bool(getattr(args, "email_disable_tls", False) or os.getenv("JOBOFCRON_SMTP_DISABLE_TLS", "").lower() in {"1", "true", "yes"})
+    use_ssl = bool(
+        args.email_use_ssl or env.get("JOBOFCRON_SMTP_USE_SSL", "").lower() in _TRUTHY
+    )
+    disable_tls = bool(
+        args.email_disable_tls or env.get("JOBOFCRON_SMTP_DISABLE_TLS", "").lower() in _TRUTHY
+    )
     use_tls = not use_ssl and not disable_tls
 
     return EmailApplicationSender(
@@ -119,6 +234,17 @@ def build_email_sender_from_args(args: argparse.Namespace) -> Optional[EmailAppl
     )
 
 
+def build_api_submitter_from_args(args: argparse.Namespace) -> Optional[ApiApplySubmitter]:
+    greenhouse_key = args.greenhouse_api_key or os.getenv("JOBOFCRON_GREENHOUSE_API_KEY")
+    lever_key = args.lever_api_key or os.getenv("JOBOFCRON_LEVER_API_KEY")
+    if not greenhouse_key and not lever_key:
+        return None
+
+    from .application_automation import ApiApplySubmitter
+
+    return ApiApplySubmitter(greenhouse_api_key=greenhouse_key, lever_api_key=lever_key)
+
+
 def _build_ai_generator(
 
     *,
@@ -144,47 +270,53 @@ def _build_ai_generator(
 
 
 def cmd_show_profile(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, _ = load_or_init(Path(args.storage))
-    print("Profile:")
-    print(f"  Name: {profile.name}")
-    print(f"  Email: {profile.email}")
+    profile, inventory, queue, history, _ = load_or_init(args.storage)
+    prefs = profile.job_preferences
+    optional = ""
     if profile.phone:
-        print(f"  Phone: {profile.phone}")
+        optional += f"  Phone: {profile.phone}\n"
     if profile.summary:
-        print(f"  Summary: {profile.summary}")
-    print("  Skills:")
-    for skill in profile.skills:
-        print(f"    - {skill}")
-    print("  Preferences:")
-    prefs = profile.job_preferences
-    print(f"    Min salary: {prefs.min_salary}")
-    print(f"    Locations: {', '.join(prefs.locations) if prefs.locations else 'None set'}")
-    print(f"    Domains: {', '.join(prefs.focus_domains) if prefs.focus_domains else 'None set'}")
-    print(f"    Felon friendly only: {'Yes' if prefs.felon_friendly_only else 'No'}")
-    print(
-        "    Blacklist: "
-        + (", ".join(prefs.blacklisted_companies) if prefs.blacklisted_companies else "None set")
-    )
+        optional += f"  Summary: {profile.summary}\n"
+    out: list[str] = [
+        _PROFILE_TEMPLATE.format_map(
+            {
+                "name": profile.name,
+                "email": profile.email,
+                "optional": optional,
+                "skills": "".join(f"    - {skill}\n" for skill in profile.skills),
+                "min_salary": prefs.min_salary,
+                "locations": ", ".join(prefs.locations) if prefs.locations else "None set",
+                "domains": ", ".join(prefs.focus_domains) if prefs.focus_domains else "None set",
+                "felon_friendly_only": "Yes" if prefs.felon_friendly_only else "No",
+                "blacklist": (
+                    ", ".join(prefs.blacklisted_companies) if prefs.blacklisted_companies else "None set"
+                ),
+            }
+        )
+    ]
 
-    print("\nTracked skills (demand vs. success):")
-    for record in inventory.sorted_by_opportunity():
-        print(
+    records = inventory.sorted_by_opportunity()
+    if records:
+        out.append("\nTracked skills (demand vs. success):")
+        out.extend(
             f"  {record.name}: seen {record.occurrences}x, interviews {record.interviews}, offers {record.offers}"
+            for record in records
         )
 
     pending = queue.pending()
-    print("\nQueued applications:")
+    out.append("\nQueued applications:")
     if not pending:
-        print("  None pending.")
+        out.append("  None pending.")
     else:
         for task in pending:
-            print(
+            out.append(
                 f"  - {task.job_id} => {task.posting.title} at {task.posting.company} scheduled for {task.apply_at.isoformat(timespec='minutes')}"
             )
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cmd_update_preferences(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, storage = load_or_init(Path(args.storage))
+    profile, inventory, queue, history, storage = load_or_init(args.storage)
     profile.job_preferences.update(
         min_salary=args.min_salary,
         locations=args.locations,
@@ -203,7 +335,7 @@ def cmd_update_preferences(args: argparse.Namespace) -> None:
 
 
 def cmd_add_skill(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, storage = load_or_init(Path(args.storage))
+    profile, inventory, queue, history, storage = load_or_init(args.storage)
     profile.add_skill(args.skill)
     inventory.observe_skills([args.skill])
     save_and_exit(profile, inventory, queue, history, storage)
@@ -211,16 +343,17 @@ def cmd_add_skill(args: argparse.Namespace) -> None:
 
 
 def cmd_plan(args: argparse.Namespace) -> None:
-    profile, inventory, queue, _, _ = load_or_init(Path(args.storage))
-    if len(args.titles) != len(args.companies):
-        raise SystemExit("--titles and --companies must have the same length")
+    from .scheduler import JobRow, plan_schedule
+
+    profile, inventory, queue, _, _ = load_or_init(args.storage)
     jobs = [
-        {"id": idx + 1, "title": title, "company": company}
+        JobRow(idx + 1, title, company)
         for idx, (title, company) in enumerate(zip(args.titles, args.companies))
     ]
     schedule = plan_schedule(
         jobs,
-        start=datetime.now(),
+        # Output is shown at minute precision, so plan from a whole minute.
+        start=datetime.now().replace(second=0, microsecond=0),
         min_interval_minutes=args.interval,
         break_every=args.break_every,
     )
@@ -230,12 +363,9 @@ def cmd_plan(args: argparse.Namespace) -> None:
 
 
 def cmd_analyze(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, storage = load_or_init(Path(args.storage))
+    profile, inventory, queue, history, storage = load_or_init(args.storage)
 
-    if args.description is None and args.description_file is None:
-        raise SystemExit("Provide either --description or --description-file")
-
-    description = args.description or Path(args.description_file).read_text(encoding="utf-8")
+    description = _load_description(args)
     posting = JobPosting(
         id=args.job_id,
         title=args.title,
@@ -256,55 +386,37 @@ def cmd_analyze(args: argparse.Namespace) -> None:
     total_skills = len(assessment.required_skills)
     matched = len(assessment.matched_skills)
     score_pct = assessment.match_score * 100
-    print(f"Match score: {score_pct:.0f}% ({matched}/{total_skills or 1} skills covered)")
+    out: list[str] = []
+    out.append(f"Match score: {score_pct:.0f}% ({matched}/{total_skills or 1} skills covered)")
 
     if assessment.required_skills:
-        print("Required skills detected:")
+        out.append("Required skills detected:")
+        matched_lower = {s.lower() for s in assessment.matched_skills}
         for skill in assessment.required_skills:
-            marker = "✔" if skill.lower() in {s.lower() for s in assessment.matched_skills} else "✖"
-            print(f"  {marker} {skill}")
-
-    if assessment.recommended_questions:
-        print("\nQuestions to clarify:")
-        for question in assessment.recommended_questions:
-            print(f"  - {question}")
-
-    if assessment.recommended_profile_updates:
-        print("\nResume/Cover letter focus:")
-        for update in assessment.recommended_profile_updates:
-            print(f"  - {update}")
-
-    if assessment.salary_notes:
-        print("\nSalary notes:")
-        for note in assessment.salary_notes:
-            print(f"  - {note}")
-    elif assessment.meets_salary is True:
-        print("\nSalary notes:")
-        print("  - Posting appears to meet your minimum salary preference.")
-
-    if assessment.location_notes:
-        print("\nLocation notes:")
-        for note in assessment.location_notes:
-            print(f"  - {note}")
-    elif assessment.meets_location is True:
-        print("\nLocation notes:")
-        print("  - Posting aligns with your saved location preferences.")
+            marker = "✔" if skill.lower() in matched_lower else "✖"
+            out.append(f"  {marker} {skill}")
+
+    for attr, header, flag, fallback in _ANALYZE_SECTIONS:
+        entries = getattr(assessment, attr)
+        if not entries and flag and getattr(assessment, flag) is True:
+            entries = (fallback,)
+        if entries:
+            out.append(f"\n{header}")
+            out.extend(f"  - {entry}" for entry in entries)
 
     if assessment.felon_friendly is True:
-        print("\nFelon-friendly signal: Posting explicitly welcomes justice-impacted candidates.")
+        out.append("\nFelon-friendly signal: Posting explicitly welcomes justice-impacted candidates.")
     elif assessment.felon_friendly is False:
-        print("\nFelon-friendly signal: Posting may require a clean record; investigate further before applying.")
+        out.append("\nFelon-friendly signal: Posting may require a clean record; investigate further before applying.")
     else:
-        print("\nFelon-friendly signal: No clear information provided; follow up if this is a requirement.")
+        out.append("\nFelon-friendly signal: No clear information provided; follow up if this is a requirement.")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cmd_generate_documents(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, storage = load_or_init(Path(args.storage))
+    profile, inventory, queue, history, storage = load_or_init(args.storage)
 
-    if args.description is None and args.description_file is None:
-        raise SystemExit("Provide either --description or --description-file")
-
-    description = args.description or Path(args.description_file).read_text(encoding="utf-8")
+    description = _load_description(args)
     posting = JobPosting(
         id=args.job_id,
         title=args.title,
@@ -331,12 +443,12 @@ def cmd_generate_documents(args: argparse.Namespace) -> None:
     cover_text: str
 
     resume_template_text = (
-        Path(args.resume_template_file).read_text(encoding="utf-8")
+        _read_text_cached(args.resume_template_file)
         if args.resume_template_file
         else None
     )
     cover_template_text = (
-        Path(args.cover_template_file).read_text(encoding="utf-8")
+        _read_text_cached(args.cover_template_file)
         if args.cover_template_file
         else None
     )
@@ -377,8 +489,8 @@ def cmd_generate_documents(args: argparse.Namespace) -> None:
             custom_template=cover_template_text,
         )
 
-    resume_path.write_text(resume_text, encoding="utf-8")
-    cover_path.write_text(cover_text, encoding="utf-8")
+    write_text_atomic(resume_path, resume_text)
+    write_text_atomic(cover_path, cover_text)
 
     print(f"Resume saved to {resume_path}")
     print(f"Cover letter saved to {cover_path}")
@@ -432,19 +544,32 @@ def cmd_generate_documents(args: argparse.Namespace) -> None:
     save_and_exit(profile, inventory, queue, history, storage)
 
 
+def _read_description_file(path: str) -> str:
+    # Unbuffered binary read: the file object sizes one read from fstat, and
+    # the whole payload is decoded in a single pass. Newlines are normalised
+    # the way text mode would so CRLF files render the same in documents.
+    with open(path, "rb", buffering=0) as handle:
+        text = handle.readall().decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
 def _load_description(args: argparse.Namespace) -> str:
     if args.description is None and args.description_file is None:
         raise SystemExit("Provide either --description or --description-file")
-    return args.description or Path(args.description_file).read_text(encoding="utf-8")
+    return args.description or _read_description_file(args.description_file)
 
 
 def cmd_apply(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, storage = load_or_init(Path(args.storage))
+    from .application_automation import AutomationDependencyError, DirectApplyAutomation
+
+    profile, inventory, queue, history, storage = load_or_init(args.storage)
 
     automation = DirectApplyAutomation(
         headless=not args.no_headless,
         timeout=args.timeout,
         enable_stealth=not args.disable_stealth,
+        api_submitter=build_api_submitter_from_args(args),
+        form_schema_path=Path(args.form_schema) if args.form_schema else None,
     )
 
     task: Optional[QueuedApplication] = None
@@ -460,7 +585,6 @@ def cmd_apply(args: argparse.Namespace) -> None:
         posting = task.posting
         resume_path = Path(task.resume_path) if task.resume_path else None
         cover_path = Path(task.cover_letter_path) if task.cover_letter_path else None
-        assessment = analyse_job_fit(profile, posting)
     else:
         if not args.apply_url:
             raise SystemExit("--apply-url is required when applying directly")
@@ -506,12 +630,12 @@ def cmd_apply(args: argparse.Namespace) -> None:
                     raise SystemExit(str(exc))
             else:
                 resume_template_text = (
-                    Path(args.resume_template_file).read_text(encoding="utf-8")
+                    _read_text_cached(args.resume_template_file)
                     if args.resume_template_file
                     else None
                 )
                 cover_template_text = (
-                    Path(args.cover_template_file).read_text(encoding="utf-8")
+                    _read_text_cached(args.cover_template_file)
                     if args.cover_template_file
                     else None
                 )
@@ -533,8 +657,8 @@ def cmd_apply(args: argparse.Namespace) -> None:
                     style=args.cover_template,
                     custom_template=cover_template_text,
                 )
-            resume_path.write_text(resume_text, encoding="utf-8")
-            cover_path.write_text(cover_text, encoding="utf-8")
+            write_text_atomic(resume_path, resume_text)
+            write_text_atomic(cover_path, cover_text)
             print(f"Generated resume at {resume_path}")
             print(f"Generated cover letter at {cover_path}")
 
@@ -656,7 +780,7 @@ def cmd_apply(args: argparse.Namespace) -> None:
 
 
 def cmd_record_outcome(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, storage = load_or_init(Path(args.storage))
+    profile, inventory, queue, history, storage = load_or_init(args.storage)
     job_id = args.queue_id
     task = queue.get(job_id)
     if not task:
@@ -678,6 +802,8 @@ def cmd_record_outcome(args: argparse.Namespace) -> None:
 
 
 def cmd_worker(args: argparse.Namespace) -> None:
+    from .worker import JobAutomationWorker
+
     documents_dir = Path(args.documents_dir)
     documents_dir.mkdir(parents=True, exist_ok=True)
     ai_generator: Optional[AIDocumentGenerator] = None
@@ -693,7 +819,7 @@ def cmd_worker(args: argparse.Namespace) -> None:
         )
     email_sender = build_email_sender_from_args(args)
     worker = JobAutomationWorker(
-        Path(args.storage),
+        args.storage,
         documents_dir=documents_dir,
         headless=not args.no_headless,
         timeout=args.timeout,
@@ -702,6 +828,11 @@ def cmd_worker(args: argparse.Namespace) -> None:
         email_sender=email_sender,
 
         enable_stealth=not args.disable_stealth,
+        cdp_endpoint=args.cdp_endpoint,
+        concurrency=args.concurrency,
+        api_submitter=build_api_submitter_from_args(args),
+        browsers_path=Path(args.browsers_path) if args.browsers_path else None,
+        form_schema_path=Path(args.form_schema) if args.form_schema else None,
 
     )
 
@@ -712,7 +843,9 @@ def cmd_worker(args: argparse.Namespace) -> None:
 
 
 def cmd_search(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, _ = load_or_init(Path(args.storage))
+    from .job_search import CraigslistSearch, GoogleJobSearch
+
+    profile, inventory, queue, history, _ = load_or_init(args.storage)
 
     location = args.location
     if not location:
@@ -732,7 +865,7 @@ def cmd_search(args: argparse.Namespace) -> None:
 
     if args.provider == "google":
         if args.sample_response:
-            payload = json.loads(Path(args.sample_response).read_text(encoding="utf-8"))
+            payload = read_json(args.sample_response)
             results = GoogleJobSearch.parse_results(payload)
         else:
             api_key = args.serpapi_key or os.getenv("SERPAPI_KEY") or os.getenv("SERPAPI_API_KEY")
@@ -762,9 +895,10 @@ def cmd_search(args: argparse.Namespace) -> None:
         )
 
     scored_results = []
-    blacklist = [entry for entry in profile.job_preferences.blacklisted_companies if entry.strip()]
+    blacklist_pattern = _blacklist_pattern(tuple(profile.job_preferences.blacklisted_companies))
     skipped_blacklisted: List[str] = []
     min_score_fraction = (args.min_match_score or 0) / 100
+    candidates = []
     for result in results:
         description = result.description or result.snippet
         posting = JobPosting(
@@ -774,14 +908,13 @@ def cmd_search(args: argparse.Namespace) -> None:
             apply_url=result.link,
             contact_email=result.contact_email,
         )
-        if blacklist and (
-            _matches_blacklist(posting.company, blacklist)
-            or _matches_blacklist(result.source, blacklist)
-            or _matches_blacklist(result.title, blacklist)
-        ):
+        if _blacklist_hit(blacklist_pattern, posting.company, result.source, result.title):
             skipped_blacklisted.append(posting.company or result.source or result.title)
             continue
-        assessment = analyse_job_fit(profile, posting)
+        candidates.append((result, posting))
+
+    assessments = analyse_job_fits(profile, [posting for _, posting in candidates], workers=args.workers)
+    for (result, posting), assessment in zip(candidates, assessments):
         result.match_score = assessment.match_score
         duplicate_note = None
         queue_match = queue.find_matching(posting)
@@ -811,57 +944,63 @@ def cmd_search(args: argparse.Namespace) -> None:
     elif args.sort_by == "date":
         results.sort(key=lambda res: res.published_at or datetime.min, reverse=True)
 
+    out: list[str] = []
     if skipped_blacklisted:
-        skipped_preview = ", ".join(sorted({name or "Unknown" for name in skipped_blacklisted})[:5])
-        print(
+        # One set serves both the preview and the ellipsis check; nsmallest
+        # picks the first five names without sorting the rest.
+        skipped_names = {name or "Unknown" for name in skipped_blacklisted}
+        skipped_preview = ", ".join(heapq.nsmallest(5, skipped_names))
+        out.append(
             f"Filtered {len(skipped_blacklisted)} result(s) due to blacklist settings: {skipped_preview}"
-            + ("..." if len(set(skipped_blacklisted)) > 5 else "")
+            + ("..." if len(skipped_names) > 5 else "")
         )
 
     if not results:
-        print("No search results found.")
+        out.append("No search results found.")
+        sys.stdout.write("\n".join(out) + "\n")
         return
 
-    print(f"Top {len(results)} results for '{args.title}' near {location} ({args.provider}):")
+    out.append(f"Top {len(results)} results for '{args.title}' near {location} ({args.provider}):")
     for idx, result in enumerate(results, start=1):
         if args.provider == "google":
             badge = "DIRECT" if result.is_company_site else "AGGREGATOR"
         else:
             badge = "DIRECT"
-        print(f"{idx:>2}. [{badge}] {result.title}")
-        print(f"    Source: {result.source}")
-        print(f"    Link:   {result.link}")
+        out.append(f"{idx:>2}. [{badge}] {result.title}")
+        out.append(f"    Source: {result.source}")
+        out.append(f"    Link:   {result.link}")
         if result.match_score is not None:
-            print(f"    Match:  {int(round(result.match_score * 100))}%")
+            out.append(f"    Match:  {result.match_score:.0%}")
         if result.is_duplicate and result.duplicate_reason:
-            print(f"    Duplicate: {result.duplicate_reason}")
+            out.append(f"    Duplicate: {result.duplicate_reason}")
         if result.contact_email:
-            print(f"    Email:  {result.contact_email}")
+            out.append(f"    Email:  {result.contact_email}")
         if args.verbose and result.snippet:
-            print(f"    Snippet: {result.snippet}")
+            out.append(f"    Snippet: {result.snippet}")
+    sys.stdout.write("\n".join(out) + "\n")
 
     if args.output:
         payload = []
         for result in results:
-            data = asdict(result)
+            # SearchResult is flat, so a shallow copy matches asdict() without
+            # its recursive per-field walk.
+            data = dict(vars(result))
             if result.match_score is not None:
-                data["match_score"] = result.match_score
                 data["match_score_percent"] = round(result.match_score * 100, 2)
             data["provider"] = args.provider
             data["searched_location"] = location
-            data["is_duplicate"] = result.is_duplicate
-            data["duplicate_reason"] = result.duplicate_reason
             payload.append(data)
-        Path(args.output).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        write_json(args.output, payload)
         print(f"Saved filtered results to {args.output}")
 
 
 def cmd_batch_queue(args: argparse.Namespace) -> None:
-    profile, inventory, queue, history, storage = load_or_init(Path(args.storage))
+    profile, inventory, queue, history, storage = load_or_init(args.storage)
 
-    payload = json.loads(Path(args.results).read_text(encoding="utf-8"))
-    if not isinstance(payload, list):
-        raise SystemExit("Results file must contain a JSON array of search results")
+    try:
+        payload = iter_json_array(args.results)
+    except ValueError as exc:
+        raise SystemExit("Results file must contain a JSON array of search results") from exc
 
     if args.min_match_score < 0 or args.min_match_score > 100:
         raise SystemExit("--min-match-score must be between 0 and 100")
@@ -871,63 +1010,63 @@ def cmd_batch_queue(args: argparse.Namespace) -> None:
     if args.resume_template == "custom":
         if not args.resume_template_file:
             raise SystemExit("--resume-template-file is required when resume template is 'custom'")
-        resume_template_text = Path(args.resume_template_file).read_text(encoding="utf-8")
+        resume_template_text = _read_text_cached(args.resume_template_file)
     elif args.resume_template_file:
-        resume_template_text = Path(args.resume_template_file).read_text(encoding="utf-8")
+        resume_template_text = _read_text_cached(args.resume_template_file)
 
     if args.cover_template == "custom":
         if not args.cover_template_file:
             raise SystemExit("--cover-template-file is required when cover template is 'custom'")
-        cover_template_text = Path(args.cover_template_file).read_text(encoding="utf-8")
+        cover_template_text = _read_text_cached(args.cover_template_file)
     elif args.cover_template_file:
-        cover_template_text = Path(args.cover_template_file).read_text(encoding="utf-8")
+        cover_template_text = _read_text_cached(args.cover_template_file)
 
     start_time = parse_iso_datetime(args.start) if args.start else datetime.now()
     interval = timedelta(minutes=args.interval_minutes)
     min_score_fraction = args.min_match_score / 100
 
+    blacklist_pattern = _blacklist_pattern(tuple(profile.job_preferences.blacklisted_companies))
     queued = 0
-    apply_at = start_time
     for item in payload:
         if not isinstance(item, dict):
             continue
-        score = item.get("match_score")
-        if score is None and item.get("match_score_percent") is not None:
-            try:
-                score = float(item.get("match_score_percent")) / 100
-            except (TypeError, ValueError):
-                score = None
+        get = item.get
+        score = get("match_score")
+        if score is None:
+            percent = get("match_score_percent")
+            if percent is not None:
+                try:
+                    score = float(percent) / 100
+                except (TypeError, ValueError):
+                    score = None
         if score is not None and score < min_score_fraction:
             continue
 
-        description = item.get("description") or item.get("snippet") or ""
-        posting = JobPosting(
-            id=item.get("id") or item.get("job_id"),
-            title=item.get("title", "Unknown role"),
-            company=item.get("company") or item.get("source", "Unknown company"),
-            location=item.get("location"),
-            salary_text=item.get("salary_text"),
-            description=description,
-            tags=list(item.get("tags", [])),
-            felon_friendly=item.get("felon_friendly"),
-            apply_url=item.get("link") or item.get("apply_url"),
-            contact_email=item.get("contact_email"),
-        )
-
-        if not posting.apply_url and not posting.contact_email:
+        apply_url = get("link") or get("apply_url")
+        contact_email = get("contact_email")
+        if not apply_url and not contact_email:
             continue
 
-        blacklist = profile.job_preferences.blacklisted_companies
-        if blacklist and (
-            _matches_blacklist(posting.company, blacklist)
-            or _matches_blacklist(item.get("source"), blacklist)
-            or _matches_blacklist(posting.title, blacklist)
-        ):
-            print(
-                f"Skipping {posting.title} at {posting.company}: company matches blacklist settings."
-            )
+        title = get("title", "Unknown role")
+        source = get("source")
+        company = get("company") or get("source", "Unknown company")
+        if _blacklist_hit(blacklist_pattern, company, source, title):
+            print(f"Skipping {title} at {company}: company matches blacklist settings.")
             continue
 
+        posting = JobPosting(
+            id=get("id") or get("job_id"),
+            title=title,
+            company=company,
+            location=get("location"),
+            salary_text=get("salary_text"),
+            description=get("description") or get("snippet") or "",
+            tags=list(get("tags", [])),
+            felon_friendly=get("felon_friendly"),
+            apply_url=apply_url,
+            contact_email=contact_email,
+        )
+
         if queue.find_matching(posting):
             print(
                 f"Skipping {posting.title} at {posting.company}: already queued."
@@ -943,7 +1082,9 @@ def cmd_batch_queue(args: argparse.Namespace) -> None:
 
         task = QueuedApplication(
             posting=posting,
-            apply_at=apply_at,
+            # Slots are derived from the accepted count, so skipped rows never
+            # shift the schedule.
+            apply_at=start_time + interval * queued,
             resume_template=args.resume_template,
             cover_letter_template=args.cover_template,
             custom_resume_template=resume_template_text,
@@ -951,7 +1092,6 @@ def cmd_batch_queue(args: argparse.Namespace) -> None:
         )
         queue.add(task)
         queued += 1
-        apply_at += interval
 
     save_and_exit(profile, inventory, queue, history, storage)
 
@@ -964,15 +1104,49 @@ def cmd_batch_queue(args: argparse.Namespace) -> None:
         print("No jobs met the filtering criteria; nothing was queued.")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Jobofcron CLI")
-    parser.add_argument("--storage", default=str(DEFAULT_STORAGE))
+COMMANDS = {
+    "show": cmd_show_profile,
+    "prefs": cmd_update_preferences,
+    "add-skill": cmd_add_skill,
+    "plan": cmd_plan,
+    "analyze": cmd_analyze,
+    "generate-docs": cmd_generate_documents,
+    "apply": cmd_apply,
+    "search": cmd_search,
+    "batch-queue": cmd_batch_queue,
+    "record-outcome": cmd_record_outcome,
+    "worker": cmd_worker,
+}
 
-    subparsers = parser.add_subparsers(dest="command", required=True)
 
-    show = subparsers.add_parser("show", help="Display the stored profile and skill stats")
-    show.set_defaults(func=cmd_show_profile)
+def _email_arguments() -> argparse.ArgumentParser:
+    """Parent parser for the SMTP options read by :func:`build_email_sender_from_args`."""
+
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--email-host")
+    parent.add_argument("--email-port", type=int)
+    parent.add_argument("--email-username")
+    parent.add_argument("--email-password")
+    parent.add_argument("--email-from")
+    parent.add_argument("--email-use-ssl", action="store_true")
+    parent.add_argument("--email-disable-tls", action="store_true")
+    return parent
+
+
+def _api_submitter_arguments() -> argparse.ArgumentParser:
+    """Parent parser for the ATS API keys read by :func:`build_api_submitter_from_args`."""
+
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument("--greenhouse-api-key", help="Submit Greenhouse applications through the job board API")
+    parent.add_argument("--lever-api-key", help="Submit Lever applications through the postings API")
+    return parent
 
+
+def _add_show_parser(subparsers: argparse._SubParsersAction) -> None:
+    subparsers.add_parser("show", help="Display the stored profile and skill stats")
+
+
+def _add_prefs_parser(subparsers: argparse._SubParsersAction) -> None:
     prefs = subparsers.add_parser("prefs", help="Update profile and job preferences")
     prefs.add_argument("--name")
     prefs.add_argument("--email")
@@ -984,19 +1158,36 @@ def build_parser() -> argparse.ArgumentParser:
     prefs.add_argument("--no-felon-friendly", dest="felon_friendly", action="store_false")
     prefs.add_argument("--blacklist", nargs="*", default=None, help="Companies to avoid during search and queueing")
     prefs.set_defaults(felon_friendly=None)
-    prefs.set_defaults(func=cmd_update_preferences)
 
+
+def _add_add_skill_parser(subparsers: argparse._SubParsersAction) -> None:
     add_skill = subparsers.add_parser("add-skill", help="Register a new skill")
     add_skill.add_argument("skill")
-    add_skill.set_defaults(func=cmd_add_skill)
 
+
+class _PairedListAction(argparse.Action):
+    """Store a list and check it against its partner once both are parsed."""
+
+    def __init__(self, option_strings, dest, *, partner: str, **kwargs) -> None:
+        super().__init__(option_strings, dest, **kwargs)
+        self.partner = partner
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        setattr(namespace, self.dest, values)
+        other = getattr(namespace, self.partner, None)
+        if other is not None and len(other) != len(values):
+            parser.error("--titles and --companies must have the same length")
+
+
+def _add_plan_parser(subparsers: argparse._SubParsersAction) -> None:
     plan = subparsers.add_parser("plan", help="Plan application pacing for a batch of jobs")
-    plan.add_argument("--titles", nargs="+", required=True)
-    plan.add_argument("--companies", nargs="+", required=True)
+    plan.add_argument("--titles", nargs="+", required=True, action=_PairedListAction, partner="companies")
+    plan.add_argument("--companies", nargs="+", required=True, action=_PairedListAction, partner="titles")
     plan.add_argument("--interval", type=int, default=10)
     plan.add_argument("--break-every", dest="break_every", type=int, default=5)
-    plan.set_defaults(func=cmd_plan)
 
+
+def _add_analyze_parser(subparsers: argparse._SubParsersAction) -> None:
     analyze = subparsers.add_parser("analyze", help="Assess how well a job posting fits the saved profile")
     analyze.add_argument("--job-id")
     analyze.add_argument("--title", required=True)
@@ -1010,8 +1201,9 @@ def build_parser() -> argparse.ArgumentParser:
     analyze.add_argument("--description")
     analyze.add_argument("--description-file")
     analyze.add_argument("--apply-url")
-    analyze.set_defaults(func=cmd_analyze)
 
+
+def _add_generate_docs_parser(subparsers: argparse._SubParsersAction) -> None:
     documents = subparsers.add_parser(
         "generate-docs",
         help="Generate resume and cover letter drafts tailored to a posting",
@@ -1065,9 +1257,12 @@ def build_parser() -> argparse.ArgumentParser:
         default="traditional",
     )
     documents.add_argument("--cover-template-file")
-    documents.set_defaults(func=cmd_generate_documents)
 
-    apply_cmd = subparsers.add_parser("apply", help="Submit an application immediately")
+
+def _add_apply_parser(subparsers: argparse._SubParsersAction) -> None:
+    apply_cmd = subparsers.add_parser(
+        "apply", help="Submit an application immediately", parents=[_email_arguments(), _api_submitter_arguments()]
+    )
     apply_cmd.add_argument("--queue-id", help="Use a queued application id instead of providing job details")
     apply_cmd.add_argument("--job-id")
     apply_cmd.add_argument("--title")
@@ -1101,6 +1296,7 @@ def build_parser() -> argparse.ArgumentParser:
         default="general",
     )
     apply_cmd.add_argument("--disable-stealth", action="store_true", help="Disable Playwright stealth hardening")
+    apply_cmd.add_argument("--form-schema", help="JSON file caching form selectors per ATS board across runs")
 
     apply_cmd.add_argument("--output-dir", default="generated_documents")
     apply_cmd.add_argument(
@@ -1115,19 +1311,13 @@ def build_parser() -> argparse.ArgumentParser:
         default="traditional",
     )
     apply_cmd.add_argument("--cover-template-file")
-    apply_cmd.add_argument("--email-host")
-    apply_cmd.add_argument("--email-port", type=int)
-    apply_cmd.add_argument("--email-username")
-    apply_cmd.add_argument("--email-password")
-    apply_cmd.add_argument("--email-from")
-    apply_cmd.add_argument("--email-use-ssl", action="store_true")
-    apply_cmd.add_argument("--email-disable-tls", action="store_true")
     apply_cmd.add_argument("--no-headless", action="store_true")
     apply_cmd.add_argument("--timeout", type=int, default=90)
     apply_cmd.add_argument("--dry-run", action="store_true")
     apply_cmd.add_argument("--retry-minutes", type=int, default=60)
-    apply_cmd.set_defaults(func=cmd_apply)
 
+
+def _add_search_parser(subparsers: argparse._SubParsersAction) -> None:
     search = subparsers.add_parser(
         "search",
         help="Discover roles via Google (SerpAPI) or Craigslist",
@@ -1136,6 +1326,11 @@ def build_parser() -> argparse.ArgumentParser:
     search.add_argument("--location", help="Location to focus on; defaults to saved prefs")
     search.add_argument("--remote", action="store_true", help="Hint the search to favour remote roles")
     search.add_argument("--limit", type=int, default=10, help="Maximum number of search results to show")
+    search.add_argument(
+        "--workers",
+        type=int,
+        help="Score results in this many processes; only pays off for batches of about 1000 or more",
+    )
     search.add_argument("--extra", nargs="*", help="Additional search terms to append")
     search.add_argument("--provider", choices=["google", "craigslist"], default="google")
     search.add_argument("--direct-only", action="store_true", help="Only show company-owned domains (Google only)")
@@ -1162,8 +1357,9 @@ def build_parser() -> argparse.ArgumentParser:
         help="Sort results by match score, published date, or company",
     )
     search.add_argument("--output", help="Write the filtered results to a JSON file for later processing")
-    search.set_defaults(func=cmd_search)
 
+
+def _add_batch_queue_parser(subparsers: argparse._SubParsersAction) -> None:
     batch = subparsers.add_parser(
         "batch-queue",
         help="Queue multiple jobs from a saved search results JSON file",
@@ -1184,8 +1380,9 @@ def build_parser() -> argparse.ArgumentParser:
         default="traditional",
     )
     batch.add_argument("--cover-template-file")
-    batch.set_defaults(func=cmd_batch_queue)
 
+
+def _add_record_outcome_parser(subparsers: argparse._SubParsersAction) -> None:
     record = subparsers.add_parser(
         "record-outcome",
         help="Log interviews/offers for queued applications and update skill stats",
@@ -1198,9 +1395,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     record.add_argument("--skills", nargs="*", help="Override which skills should be credited")
     record.add_argument("--note", help="Optional note to attach to the queue entry")
-    record.set_defaults(func=cmd_record_outcome)
 
-    worker = subparsers.add_parser("worker", help="Process queued applications on a schedule")
+
+def _add_worker_parser(subparsers: argparse._SubParsersAction) -> None:
+    worker = subparsers.add_parser(
+        "worker", help="Process queued applications on a schedule", parents=[_email_arguments(), _api_submitter_arguments()]
+    )
     worker.add_argument("--documents-dir", default="generated_documents")
     worker.add_argument("--loop", action="store_true", help="Keep running instead of exiting after one pass")
     worker.add_argument("--interval", type=int, default=300, help="Seconds to wait between polling runs")
@@ -1224,23 +1424,67 @@ def build_parser() -> argparse.ArgumentParser:
         default="general",
     )
     worker.add_argument("--disable-stealth", action="store_true", help="Disable Playwright stealth hardening")
+    worker.add_argument(
+        "--concurrency", type=int, default=4, help="Number of browser applications to run at the same time"
+    )
+    worker.add_argument("--browsers-path", help="Directory Playwright should install and load browsers from")
+    worker.add_argument("--form-schema", help="JSON file caching form selectors per ATS board across runs")
+    worker.add_argument("--cdp-endpoint", help="Attach to an already running Chromium over CDP instead of launching one")
+
+
+# Subcommand name -> function registering its parser. ``main`` only builds the
+# one being run; help and error output still get the full parser.
+_SUBPARSER_BUILDERS = {
+    "show": _add_show_parser,
+    "prefs": _add_prefs_parser,
+    "add-skill": _add_add_skill_parser,
+    "plan": _add_plan_parser,
+    "analyze": _add_analyze_parser,
+    "generate-docs": _add_generate_docs_parser,
+    "apply": _add_apply_parser,
+    "search": _add_search_parser,
+    "batch-queue": _add_batch_queue_parser,
+    "record-outcome": _add_record_outcome_parser,
+    "worker": _add_worker_parser,
+}
+
+
+@lru_cache(maxsize=None)
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, restricted to ``command`` when it is a known subcommand."""
 
-    worker.add_argument("--email-host")
-    worker.add_argument("--email-port", type=int)
-    worker.add_argument("--email-username")
-    worker.add_argument("--email-password")
-    worker.add_argument("--email-from")
-    worker.add_argument("--email-use-ssl", action="store_true")
-    worker.add_argument("--email-disable-tls", action="store_true")
-    worker.set_defaults(func=cmd_worker)
+    parser = argparse.ArgumentParser(description="Jobofcron CLI")
+    parser.add_argument("--storage", type=Path, default=DEFAULT_STORAGE)
 
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    builder = _SUBPARSER_BUILDERS.get(command) if command else None
+    for add_parser in (builder,) if builder else _SUBPARSER_BUILDERS.values():
+        add_parser(subparsers)
     return parser
 
 
+def _peek_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in ``argv`` without building a parser."""
+
+    args = iter(argv)
+    for token in args:
+        if token == "--storage":
+            next(args, None)
+        elif token.startswith("--storage="):
+            continue
+        elif token.startswith("-"):
+            return None
+        else:
+            return token
+    return None
+
+
 def main(argv: List[str] | None = None) -> None:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(_peek_command(argv))
     args = parser.parse_args(argv)
-    args.func(args)
+    COMMANDS[args.command](args)
 
 
 if __name__ == "__main__":
@@ -3,18 +3,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional
 from urllib.parse import urlparse
 
-from .job_matching import JobPosting
-
-
-def _normalise_text(value: Optional[str]) -> str:
-    if not value:
-        return ""
-    return " ".join(value.strip().lower().split())
+from .job_matching import JobPosting, normalise_text
 
 
+@lru_cache(maxsize=4096)
 def _normalise_url(url: Optional[str]) -> Optional[str]:
     if not url:
         return None
@@ -28,8 +24,8 @@ def _normalise_url(url: Optional[str]) -> Optional[str]:
 
 
 def _combo_key(title: Optional[str], company: Optional[str]) -> Optional[str]:
-    title_key = _normalise_text(title)
-    company_key = _normalise_text(company)
+    title_key = normalise_text(title)
+    company_key = normalise_text(company)
     if not title_key and not company_key:
         return None
     return f"role::{company_key}::{title_key}"
@@ -96,7 +92,7 @@ class AppliedJobRegistry:
         if combo:
             keys.append(combo)
         if not keys:
-            fallback = _normalise_text(posting.title) or "unknown"
+            fallback = normalise_text(posting.title) or "unknown"
             keys.append(f"fallback::{fallback}")
         return keys
 
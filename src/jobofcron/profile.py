@@ -7,7 +7,7 @@ avoid persistence and I/O so they can be reused in different environments
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -36,7 +36,13 @@ class JobPreference:
     def to_dict(self) -> Dict[str, object]:
         """Serialise the preference to a plain dictionary."""
 
-        return asdict(self)
+        return {
+            "min_salary": self.min_salary,
+            "locations": list(self.locations),
+            "focus_domains": list(self.focus_domains),
+            "felon_friendly_only": self.felon_friendly_only,
+            "blacklisted_companies": list(self.blacklisted_companies),
+        }
 
     def update(
         self,
@@ -121,19 +127,28 @@ class CandidateProfile:
     def to_dict(self) -> Dict[str, object]:
         """Return a serialisable representation of the profile."""
 
-        profile = asdict(self)
-        profile["experiences"] = [
-            {
-                "company": exp.company,
-                "role": exp.role,
-                "start_date": exp.start_date.isoformat(),
-                "end_date": exp.end_date.isoformat() if exp.end_date else None,
-                "achievements": list(exp.achievements),
-            }
-            for exp in self.experiences
-        ]
-        profile["job_preferences"] = self.job_preferences.to_dict()
-        return profile
+        # Built field by field: ``asdict`` would deep-copy the experiences and
+        # preferences only for them to be replaced by their serialised forms.
+        return {
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "summary": self.summary,
+            "skills": list(self.skills),
+            "certifications": list(self.certifications),
+            "experiences": [
+                {
+                    "company": exp.company,
+                    "role": exp.role,
+                    "start_date": exp.start_date.isoformat(),
+                    "end_date": exp.end_date.isoformat() if exp.end_date else None,
+                    "achievements": list(exp.achievements),
+                }
+                for exp in self.experiences
+            ],
+            "job_preferences": self.job_preferences.to_dict(),
+            "additional_notes": dict(self.additional_notes),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "CandidateProfile":
@@ -3,7 +3,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Sequence
+from typing import List, NamedTuple, Sequence, Union
+
+
+class JobRow(NamedTuple):
+    """Lightweight job record accepted by :func:`plan_schedule`."""
+
+    id: int
+    title: str
+    company: str
 
 
 @dataclass
@@ -15,7 +23,7 @@ class ScheduledApplication:
 
 
 def plan_schedule(
-    jobs: Sequence[dict],
+    jobs: Sequence[Union[JobRow, dict]],
     *,
     start: datetime,
     min_interval_minutes: int = 10,
@@ -25,7 +33,8 @@ def plan_schedule(
     """Create a paced schedule for applying to jobs.
 
     Args:
-        jobs: Iterable of job dictionaries with ``id``, ``title`` and ``company``.
+        jobs: :class:`JobRow` records or dictionaries with ``id``, ``title`` and
+            ``company``.
         start: When to begin applying.
         min_interval_minutes: Minimum spacing between applications.
         break_every: After how many applications to insert a break.
@@ -42,11 +51,15 @@ def plan_schedule(
     interval = timedelta(minutes=min_interval_minutes)
 
     for index, job in enumerate(jobs, start=1):
+        if isinstance(job, JobRow):
+            job_id, title, company = job
+        else:
+            job_id, title, company = job.get("id"), job.get("title", ""), job.get("company", "")
         schedule.append(
             ScheduledApplication(
-                job_id=str(job.get("id")),
-                job_title=job.get("title", ""),
-                company=job.get("company", ""),
+                job_id=str(job_id),
+                job_title=title,
+                company=company,
                 apply_at=current_time,
             )
         )
@@ -98,6 +98,8 @@ class SkillsInventory:
     def sorted_by_opportunity(self) -> List[SkillRecord]:
         """Return skills sorted by high demand but low success so far."""
 
+        if not self._skills:
+            return []
         return sorted(
             self._skills.values(),
             key=lambda record: (
@@ -1,21 +1,164 @@
-"""Simple JSON-based persistence for the job application assistant."""
+"""Simple JSON-based persistence for the job application assistant.
+
+Paths ending in ``.msgpack`` are stored as a versioned MessagePack blob
+instead, which is smaller and faster to parse for large queues.
+"""
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
+import tempfile
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from .application_queue import ApplicationQueue
 from .job_history import AppliedJobRegistry
 from .profile import CandidateProfile
 from .skills_inventory import SkillsInventory
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # pragma: no cover - optional dependency
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    ijson = None
+
+# Header written in front of MessagePack payloads; files without it are JSON.
+_MSGPACK_MAGIC = b"JOFC\x01"
+
+
+class StorageDependencyError(RuntimeError):
+    """Raised when the optional binary storage dependency is missing."""
+
+
+def _load_msgpack():
+    try:
+        import msgpack
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+        raise StorageDependencyError(
+            "Install the 'fast' optional dependency group (pip install jobofcron[fast]) "
+            "to use .msgpack storage"
+        ) from exc
+    return msgpack
+
+
+def _loads(raw: bytes) -> Any:
+    if raw.startswith(_MSGPACK_MAGIC):
+        return _load_msgpack().unpackb(raw[len(_MSGPACK_MAGIC):], raw=False)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def write_json(path: Path, payload: Any) -> None:
+    """Write ``payload`` as indented JSON in one call, ISO-formatting datetimes."""
+
+    if orjson is not None:
+        raw = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(payload, indent=2, default=_json_default).encode("utf-8")
+    _replace_atomically(Path(path), raw)
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file with the fastest available backend."""
+
+    return _loads(Path(path).read_bytes())
+
+
+def iter_json_array(path: Path) -> Iterator[Any]:
+    """Iterate over a top-level JSON array, streaming it when ijson is installed.
+
+    Raises :class:`ValueError` straight away when the document is not an array.
+    """
+
+    if ijson is None:
+        payload = read_json(path)
+        if not isinstance(payload, list):
+            raise ValueError(f"{path} does not contain a JSON array")
+        return iter(payload)
+
+    with open(path, "rb") as handle:
+        head = handle.read(64).lstrip()
+    if not head.startswith(b"["):
+        raise ValueError(f"{path} does not contain a JSON array")
+    return _stream_json_array(path)
+
+
+def _stream_json_array(path: Path) -> Iterator[Any]:
+    with open(path, "rb", buffering=1 << 20) as handle:
+        yield from ijson.items(handle, "item", use_float=True)
+
+
+# mkstemp creates files as 0600; new files get the mode a plain open() would
+# give them. The umask can only be read by setting it, so do that once here
+# rather than racing other threads on every write.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def _replace_atomically(path: Path, raw: bytes) -> None:
+    # Write to a unique file beside the target and rename over it so an
+    # interrupted write never leaves a truncated file behind, and concurrent
+    # writers never share a temporary file.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.fchmod(fd, mode)
+        view = memoryview(raw)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp)
+        raise
+    os.close(fd)
+    os.replace(tmp, path)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write ``text`` as UTF-8, replacing ``path`` in a single rename."""
+
+    _replace_atomically(path, text.encode("utf-8"))
+
 
 class Storage:
     """Persist profile and skills inventory to a JSON file."""
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, *, cache: bool = False) -> None:
         self.path = path
+        self.binary = path.suffix == ".msgpack"
+        # Opt-in for long-lived callers such as the worker loop: keep the last
+        # loaded or saved payload, validated against the file's (mtime_ns,
+        # size), so an unchanged file is not parsed again. It is pickled so
+        # every hit hands out fresh objects that callers are free to mutate.
+        self.cache = cache
+        self._cached: tuple[int, int, bytes, bytes] | None = None
+        self._digest: bytes | None = None
 
     def load(
         self,
@@ -28,7 +171,7 @@ class Storage:
         if not self.path.exists():
             return None, None, ApplicationQueue(), AppliedJobRegistry()
 
-        data = json.loads(self.path.read_text(encoding="utf-8"))
+        data = self._read()
         profile_data: Dict[str, Any] | None = data.get("profile")
         skills_data: Dict[str, Dict[str, Any]] | None = data.get("skills")
         queue_data = data.get("queue", [])
@@ -40,6 +183,32 @@ class Storage:
         history = AppliedJobRegistry.from_snapshot(history_data)
         return profile, skills, queue, history
 
+    def _read(self) -> Dict[str, Any]:
+        if not self.cache:
+            raw = self.path.read_bytes()
+            self._digest = hashlib.blake2b(raw).digest()
+            return _loads(raw)
+
+        stat = self.path.stat()
+        cached = self._cached
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            self._digest = cached[2]
+            return pickle.loads(cached[3])
+
+        raw = self.path.read_bytes()
+        self._digest = hashlib.blake2b(raw).digest()
+        data = _loads(raw)
+        self._remember(stat, data)
+        return data
+
+    def _remember(self, stat: os.stat_result, payload: Dict[str, Any]) -> None:
+        self._cached = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            self._digest,
+            pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
     def save(
         self,
         profile: CandidateProfile,
@@ -47,12 +216,61 @@ class Storage:
         queue: ApplicationQueue | None = None,
         history: AppliedJobRegistry | None = None,
     ) -> None:
+        payload = self._payload(profile, skills, queue, history)
+        self._write(self._encode(payload), payload=payload)
+
+    def save_if_dirty(
+        self,
+        profile: CandidateProfile,
+        skills: SkillsInventory,
+        queue: ApplicationQueue | None = None,
+        history: AppliedJobRegistry | None = None,
+    ) -> bool:
+        """Save only when the state differs from what was last loaded or saved.
+
+        Returns ``True`` when the file was written.
+        """
+
+        payload = self._payload(profile, skills, queue, history)
+        raw = self._encode(payload)
+        digest = hashlib.blake2b(raw).digest()
+        if digest == self._digest:
+            return False
+        self._write(raw, digest, payload=payload)
+        return True
+
+    @staticmethod
+    def _payload(
+        profile: CandidateProfile,
+        skills: SkillsInventory,
+        queue: ApplicationQueue | None,
+        history: AppliedJobRegistry | None,
+    ) -> Dict[str, Any]:
         queue = queue or ApplicationQueue()
         history = history or AppliedJobRegistry()
-        payload = {
+        return {
             "profile": profile.to_dict(),
             "skills": skills.to_snapshot(),
             "queue": queue.to_snapshot(),
             "history": history.to_snapshot(),
         }
-        self.path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+    def _encode(self, payload: Dict[str, Any]) -> bytes:
+        if self.binary:
+            return _MSGPACK_MAGIC + _load_msgpack().packb(payload, use_bin_type=True)
+        return _dumps(payload)
+
+    def _write(
+        self,
+        raw: bytes,
+        digest: bytes | None = None,
+        *,
+        payload: Dict[str, Any] | None = None,
+    ) -> None:
+        _replace_atomically(self.path, raw)
+        self._digest = digest or hashlib.blake2b(raw).digest()
+        self._cached = None
+        if self.cache and payload is not None:
+            # Seed the cache with what was just written so the worker loop
+            # reloads its own state without re-parsing.
+            self._remember(self.path.stat(), payload)
@@ -40,7 +40,7 @@ if __package__ in {None, ""}:
     from jobofcron.job_search import CraigslistSearch, GoogleJobSearch, SearchResult  # type: ignore[attr-defined]
     from jobofcron.profile import CandidateProfile  # type: ignore[attr-defined]
     from jobofcron.skills_inventory import SkillsInventory  # type: ignore[attr-defined]
-    from jobofcron.storage import Storage  # type: ignore[attr-defined]
+    from jobofcron.storage import Storage, write_text_atomic  # type: ignore[attr-defined]
 else:
     from .application_queue import ApplicationQueue, QueuedApplication
     from .document_generation import (
@@ -57,7 +57,7 @@ else:
     from .job_search import CraigslistSearch, GoogleJobSearch, SearchResult
     from .profile import CandidateProfile
     from .skills_inventory import SkillsInventory
-    from .storage import Storage
+    from .storage import Storage, write_text_atomic
 
 
 
@@ -1392,8 +1392,8 @@ def _render_documents_tab() -> None:
     slug = _slugify(posting.title, posting.company)
     resume_path = directory / f"{slug}_resume.md"
     cover_path = directory / f"{slug}_cover_letter.md"
-    resume_path.write_text(resume_text, encoding="utf-8")
-    cover_path.write_text(cover_text, encoding="utf-8")
+    write_text_atomic(resume_path, resume_text)
+    write_text_atomic(cover_path, cover_text)
 
     st.success("Documents generated.")
     st.write(f"Resume saved to {resume_path}")
@@ -1515,7 +1515,7 @@ def _render_queue_tab() -> None:
                 _save_state()
                 st.success(f"Rescheduled for {new_time.isoformat(timespec='minutes')}.")
             if col3.button("Remove", key=f"queue_remove_{idx}"):
-                queue.items.pop(idx)
+                queue.remove(application.job_id)
                 _save_state()
                 st.experimental_rerun()
 
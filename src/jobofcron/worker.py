@@ -1,12 +1,20 @@
 """Background worker for orchestrating scheduled applications."""
 from __future__ import annotations
 
+import re
 import time
+from contextlib import ExitStack
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-from .application_automation import AutomationDependencyError, DirectApplyAutomation, EmailApplicationSender
+from .application_automation import (
+    ApiApplySubmitter,
+    ApplyJob,
+    AutomationDependencyError,
+    DirectApplyAutomation,
+    EmailApplicationSender,
+)
 from .application_queue import ApplicationQueue, QueuedApplication
 from .document_generation import (
     AIDocumentGenerator,
@@ -18,12 +26,15 @@ from .job_history import AppliedJobRegistry
 from .job_matching import MatchAssessment, analyse_job_fit
 from .profile import CandidateProfile
 from .skills_inventory import SkillsInventory
-from .storage import Storage
+from .storage import Storage, write_text_atomic
+
+
+_SLUG_STRIP = re.compile(r"[^\w-]+")
 
 
 def _slugify(*parts: str) -> str:
     cleaned = "-".join(part.strip().lower().replace(" ", "-") for part in parts if part)
-    return "".join(char for char in cleaned if char.isalnum() or char in {"-", "_"})
+    return _SLUG_STRIP.sub("", cleaned)
 
 
 class JobAutomationWorker:
@@ -41,17 +52,28 @@ class JobAutomationWorker:
         email_sender: Optional[EmailApplicationSender] = None,
 
         enable_stealth: bool = True,
+        cdp_endpoint: Optional[str] = None,
+        concurrency: int = 4,
+        api_submitter: Optional[ApiApplySubmitter] = None,
+        browsers_path: Optional[Path] = None,
+        form_schema_path: Optional[Path] = None,
 
     ) -> None:
         self.storage = Storage(storage_path)
         self.documents_dir = documents_dir or Path("generated_documents")
         self.documents_dir.mkdir(parents=True, exist_ok=True)
         self.retry_delay = retry_delay
+        self.concurrency = concurrency
+        self._keep_browser_warm = False
 
         self.automation = DirectApplyAutomation(
             headless=headless,
             timeout=timeout,
             enable_stealth=enable_stealth,
+            cdp_endpoint=cdp_endpoint,
+            api_submitter=api_submitter,
+            browsers_path=browsers_path,
+            form_schema_path=form_schema_path,
         )
 
         self.ai_generator = ai_generator
@@ -66,14 +88,18 @@ class JobAutomationWorker:
             print("No pending applications ready to run.")
             return
 
-        for task in due:
-            print(f"Processing {task.posting.title} at {task.posting.company} (job id: {task.job_id})")
-            assessment = analyse_job_fit(profile, task.posting)
-            inventory.observe_skills(assessment.required_skills)
+        browser_tasks: list[tuple[QueuedApplication, ApplyJob]] = []
+        with ExitStack() as stack:
+            if self.email_sender is not None:
+                # Email applications in this pass share one SMTP session.
+                stack.enter_context(self.email_sender)
+            for task in due:
+                print(f"Processing {task.posting.title} at {task.posting.company} (job id: {task.job_id})")
+                assessment = analyse_job_fit(profile, task.posting)
+                inventory.observe_skills(assessment.required_skills)
 
-            resume_path, cover_path = self._ensure_documents(task, profile, assessment)
+                resume_path, cover_path = self._ensure_documents(task, profile, assessment)
 
-            try:
                 email_target = bool(
                     task.posting.contact_email
                     or (task.posting.apply_url and task.posting.apply_url.startswith("mailto:"))
@@ -112,36 +138,56 @@ class JobAutomationWorker:
                     task.notes.append("Dry run executed; application remains queued for a real run.")
                     task.defer(now + self.retry_delay)
                     continue
-                else:
-                    submitted = self.automation.apply(
-                        profile,
-                        task.posting,
-                        resume_path=resume_path,
-                        cover_letter_path=cover_path,
-                    )
-                    if submitted:
-                        task.mark_success()
-                        history.record(task.posting, status=task.status)
-                    else:
-                        task.mark_failure("No submit button detected")
-                        task.defer(now + self.retry_delay)
-                        print("Submit control not detected; task re-queued.")
-                        continue
-            except AutomationDependencyError as exc:
-                task.mark_failure(str(exc))
-                task.defer(now + self.retry_delay)
-                print(f"Automation dependency missing: {exc}")
+
+                browser_tasks.append(
+                    (task, ApplyJob(task.posting, resume_path=resume_path, cover_letter_path=cover_path))
+                )
+
+        if browser_tasks:
+            # Browser submissions share one pool and run concurrently.
+            try:
+                if self._keep_browser_warm and not self.automation.pool_running:
+                    self.automation.open_session(self.concurrency)
+                results = self.automation.apply_batch(
+                    profile,
+                    [job for _, job in browser_tasks],
+                    concurrency=self.concurrency,
+                )
             except Exception as exc:  # pragma: no cover - integration heavy
-                task.mark_failure(str(exc))
-                task.defer(now + self.retry_delay)
-                print(f"Automation failed: {exc}")
+                results = [exc] * len(browser_tasks)
+
+            for (task, _), result in zip(browser_tasks, results):
+                if result is True:
+                    task.mark_success()
+                    history.record(task.posting, status=task.status)
+                elif isinstance(result, AutomationDependencyError):
+                    task.mark_failure(str(result))
+                    task.defer(now + self.retry_delay)
+                    print(f"Automation dependency missing: {result}")
+                elif isinstance(result, BaseException):
+                    task.mark_failure(str(result))
+                    task.defer(now + self.retry_delay)
+                    print(f"Automation failed for {task.job_id}: {result}")
+                else:
+                    task.mark_failure("No submit button detected")
+                    task.defer(now + self.retry_delay)
+                    print(f"Submit control not detected for {task.job_id}; task re-queued.")
 
-        self.storage.save(profile, inventory, queue, history)
+        self.storage.save_if_dirty(profile, inventory, queue, history)
 
     def run_forever(self, *, interval: int = 300, dry_run: bool = False) -> None:
-        while True:
-            self.run_once(dry_run=dry_run)
-            time.sleep(interval)
+        # Keep the browser pool alive between ticks so only the first pass
+        # pays for launching Chromium, and keep the decoded state around so
+        # an unchanged data file is not re-parsed every tick.
+        self._keep_browser_warm = True
+        self.storage.cache = True
+        try:
+            while True:
+                self.run_once(dry_run=dry_run)
+                time.sleep(interval)
+        finally:
+            self._keep_browser_warm = False
+            self.automation.close_session()
 
     def _ensure_documents(
         self,
@@ -177,7 +223,7 @@ class JobAutomationWorker:
                 style=task.resume_template,
                 custom_template=task.custom_resume_template,
             )
-        resume_path.write_text(resume_text, encoding="utf-8")
+        write_text_atomic(resume_path, resume_text)
         task.resume_path = str(resume_path)
 
         if self.ai_generator is not None:
@@ -200,7 +246,7 @@ class JobAutomationWorker:
                 style=task.cover_letter_template,
                 custom_template=task.custom_cover_letter_template,
             )
-        cover_path.write_text(cover_letter, encoding="utf-8")
+        write_text_atomic(cover_path, cover_letter)
         task.cover_letter_path = str(cover_path)
 
         return resume_path, cover_path